@@ -73,9 +73,9 @@ class App:
         """
         Submits a batch of simulation jobs to the job manager based on the provided input sequences.
 
-        Each input sequence is converted into an Input object and then submitted as a new simulation
-        job through the JobManager. This method is ideal for bulk submission of jobs to utilize
-        hardware resources efficiently.
+        Each input sequence is converted into an Input object and the resulting inputs are then
+        submitted together as new simulation jobs through the JobManager. This method is ideal
+        for bulk submission of jobs to utilize hardware resources efficiently.
 
         Parameters
         ----------
@@ -98,11 +98,7 @@ class App:
         This demonstrates submitting two jobs to the simulation environment with different input parameters.
         """
 
-        submitted_jobs = []
-        for inp in inputs:
-            submitted_jobs.append(self._job_manager.submit(Input(*inp)))
-
-        return tuple(submitted_jobs)
+        return self._job_manager.submit_many([Input(*inp) for inp in inputs])
 
     def cancel(self, job_ids: Sequence[Union[str, JobId, int]]) -> dict[str, list]:
         """Cancels jobs and returns a report detailing results of the cancellations.
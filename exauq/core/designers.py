@@ -1001,7 +1001,11 @@ def compute_zero_mean_prediction(
         If `gp` hasn't been trained on any data.
     """
     training_inputs = [datum.input for datum in gp.training_data]
-    training_outputs = np.array([[datum.output] for datum in gp.training_data])
+    training_outputs = np.fromiter(
+        (datum.output for datum in gp.training_data),
+        dtype=np.float64,
+        count=len(gp.training_data),
+    ).reshape(-1, 1)
 
     try:
 
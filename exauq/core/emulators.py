@@ -89,7 +89,9 @@ class MogpEmulator(AbstractGaussianProcess):
 
     @suppress_print
     def __init__(self, **kwargs):
-        self._gp_kwargs = self._remove_entries(kwargs, "inputs", "targets")
+        kwargs.pop("inputs", None)
+        kwargs.pop("targets", None)
+        self._gp_kwargs = kwargs
         self._validate_kernel(self._gp_kwargs)
         self._kernel = (
             self._kernel_funcs[self._gp_kwargs["kernel"]]
@@ -107,18 +109,15 @@ class MogpEmulator(AbstractGaussianProcess):
         )
         self._fit_hyperparameters = None
 
+        # Dimension of the training inputs, or None if not trained on data
+        self._input_dim = None
+
         # Correlation length scale parameters on a negative log scale
         self._corr_transformed = None
 
         # Inverse of covariance matrix
         self._kinv = np.array([])
 
-    @staticmethod
-    def _remove_entries(_dict: dict, *args) -> dict:
-        """Return a dict with the specified keys removed."""
-
-        return {k: v for (k, v) in _dict.items() if k not in args}
-
     @classmethod
     def _validate_kernel(cls, kwargs):
         try:
@@ -243,8 +242,7 @@ class MogpEmulator(AbstractGaussianProcess):
 
         self._validate_hyperparameter_bounds(hyperparameter_bounds)
 
-        inputs = np.array([datum.input.value for datum in training_data])
-        targets = np.array([datum.output for datum in training_data])
+        inputs, targets = TrainingDatum.arrays_from_list(training_data)
         if hyperparameters is None:
             self._fit_gp_with_estimation(
                 inputs, targets, hyperparameter_bounds=hyperparameter_bounds
@@ -264,6 +262,7 @@ class MogpEmulator(AbstractGaussianProcess):
 
         self._corr_transformed = self._gp.theta.corr_raw
         self._training_data = training_data
+        self._input_dim = inputs.shape[1]
         self._kinv = self._compute_kinv()
 
         return None
@@ -382,9 +381,10 @@ class MogpEmulator(AbstractGaussianProcess):
         nugget_type = "fixed"
         _hyperparameters = hyperparameters
 
-        # Fit using supplied nugget hyperparameter if available...
+        # Fit using supplied nugget hyperparameter if available (without overwriting the
+        # nugget given at GP construction)...
         if hyperparameters.nugget is not None:
-            kwargs["nugget"] = hyperparameters.nugget
+            kwargs = {**kwargs, "nugget": hyperparameters.nugget}
 
         # ... Otherwise use the nugget given at GP construction, if a real number...
         elif isinstance(kwargs["nugget"], Real):
@@ -424,12 +424,14 @@ class MogpEmulator(AbstractGaussianProcess):
         # Note: we need to swap the order of the bounds for correlation, because
         # _raw_from_corr is a decreasing function (i.e. min of raw corresponds
         # to max of correlation and vice-versa).
+        corr_bounds = bounds[:-1]
+        raw_corr = MogpEmulator._transform_corr_bounds(corr_bounds)
         raw_bounds = [
             (
-                MogpEmulator._transform_corr(bnd[1]),
-                MogpEmulator._transform_corr(bnd[0]),
+                None if bnd[1] is None else float(raw[1]),
+                None if bnd[0] is None else float(raw[0]),
             )
-            for bnd in bounds[:-1]
+            for bnd, raw in zip(corr_bounds, raw_corr)
         ] + [
             (
                 MogpEmulator._transform_cov(bounds[-1][0]),
@@ -438,6 +440,28 @@ class MogpEmulator(AbstractGaussianProcess):
         ]
         return tuple(raw_bounds)
 
+    @staticmethod
+    def _transform_corr_bounds(corr_bounds: Sequence[OptionalFloatPairs]) -> NDArray:
+        """Transform bounds on correlation length scales to raw values in one go.
+
+        Returns an array of shape ``(len(corr_bounds), 2)`` whose rows are the
+        transformed (lower, upper) bounds, in the same order as the input. Entries
+        corresponding to ``None`` bounds are NaN and should be ignored by the caller.
+        """
+
+        values = [v for bnd in corr_bounds for v in bnd if v is not None]
+        if not all(isinstance(v, Real) and v >= 0 for v in values):
+            # Defer to the scalar transformation to raise the appropriate error
+            for v in values:
+                MogpEmulator._transform_corr(v)
+
+        arr = np.array(
+            [[np.nan if v is None else v for v in bnd] for bnd in corr_bounds],
+            dtype=float,
+        ).reshape(-1, 2)
+        with np.errstate(divide="ignore"):
+            return -2 * np.log(arr)
+
     @staticmethod
     def _transform_corr(corr: Optional[Real]) -> Optional[Real]:
         return MogpHyperparameters.transform_corr(corr) if corr is not None else None
@@ -507,7 +531,7 @@ class MogpEmulator(AbstractGaussianProcess):
             )
 
         except ValueError:
-            expected_dim = len(self.training_data[0].input)
+            expected_dim = self._get_input_dim()
             wrong_dims = list(
                 len(x)
                 for x in itertools.chain(inputs1, inputs2)
@@ -596,24 +620,98 @@ class MogpEmulator(AbstractGaussianProcess):
                 f"it has {len(x)} instead."
             )
 
-        return self._to_prediction(self.gp.predict(np.array(x)))
+        # Copy the coordinates into a tuple with one pass of Input.__iter__, so that
+        # numpy builds the array from a plain tuple rather than inspecting the Input as
+        # a generic sequence.
+        return self._to_predictions(self.gp.predict(np.array([tuple(x)], dtype=float)))[0]
+
+    def predict_batch(
+        self, inputs: Sequence[Input]
+    ) -> tuple[GaussianProcessPrediction, ...]:
+        """Make predictions of simulator outputs for a sequence of inputs.
+
+        This gives the same predictions as calling `predict` on each of the inputs in
+        turn, but evaluates them all with a single call to the underlying
+        ``GaussianProcess``, which is considerably more efficient for many inputs.
+
+        Parameters
+        ----------
+        inputs : Sequence[Input]
+            A sequence of simulator inputs.
+
+        Returns
+        -------
+        tuple[GaussianProcessPrediction, ...]
+            The Gaussian process's predictions of the simulator outputs, in the same order
+            as the corresponding `inputs`.
+
+        Raises
+        ------
+        TypeError
+            If `inputs` is not a sequence, or contains objects that are not of type
+            `Input`.
+        RuntimeError
+            If this emulator has not been trained on any data before making the
+            predictions.
+        ValueError
+            If the dimension of any of the supplied inputs doesn't match the dimension of
+            training data inputs for this emulator.
+        """
+
+        if not isinstance(inputs, Sequence):
+            raise TypeError(
+                "Expected 'inputs' to be a sequence of Input objects, but received "
+                f"{type(inputs)} instead."
+            )
+
+        if not all(isinstance(x, Input) for x in inputs):
+            raise TypeError("Expected 'inputs' to only contain Input objects.")
+
+        if len(self.training_data) == 0:
+            raise RuntimeError(
+                "Cannot make prediction because emulator has not been trained on any data."
+            )
+
+        if not inputs:
+            return tuple()
+
+        expected_dim = self._get_input_dim()
+        if wrong_dims := [len(x) for x in inputs if len(x) != expected_dim]:
+            raise ValueError(
+                f"Expected inputs to have dimension equal to {expected_dim}, but "
+                f"received input of dimension {wrong_dims[0]}."
+            )
+
+        n_inputs = len(inputs)
+        inputs_array = np.fromiter(
+            itertools.chain.from_iterable(inputs),
+            dtype=float,
+            count=n_inputs * expected_dim,
+        ).reshape(n_inputs, expected_dim)
+
+        return self._to_predictions(self.gp.predict(inputs_array))
 
     def _get_input_dim(self) -> Optional[int]:
-        """Get the dimension of the inputs in the training data. Note: assumes that
-        each input in the training data has the same dimension."""
-        try:
-            return len(self.training_data[0].input)
-        except IndexError:
-            return None
+        """Get the dimension of the inputs in the training data, or ``None`` if the
+        emulator has not been trained on data. Note: assumes that each input in the
+        training data has the same dimension."""
+
+        return self._input_dim
 
     @staticmethod
-    def _to_prediction(mogp_predict_result) -> GaussianProcessPrediction:
-        """Convert an MOGP ``PredictResult`` to a ``GaussianProcessPrediction`` object.
+    def _to_predictions(
+        mogp_predict_result,
+    ) -> tuple[GaussianProcessPrediction, ...]:
+        """Convert an MOGP ``PredictResult`` to ``GaussianProcessPrediction`` objects, one
+        for each input that the prediction was made at.
 
         See https://mogp-emulator.readthedocs.io/en/latest/implementation/GaussianProcess.html#the-predictresult-class
         """
-        return GaussianProcessPrediction(
-            estimate=mogp_predict_result.mean[0], variance=mogp_predict_result.unc[0]
+        return tuple(
+            GaussianProcessPrediction(estimate=estimate, variance=variance)
+            for estimate, variance in zip(
+                mogp_predict_result.mean, mogp_predict_result.unc
+            )
         )
 
 
@@ -681,11 +779,27 @@ class MogpHyperparameters(GaussianProcessHyperparameters):
                 "variance equal to None in 'params'."
             )
 
-        return cls(
-            corr_length_scales=params.corr,
-            process_var=params.cov,
-            nugget=params.nugget,
-        )
+        # mogp-emulator enforces positivity of these parameters itself, so skip
+        # re-validating them.
+        return cls._unchecked(params.corr, params.cov, params.nugget)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        corr_length_scales: NDArray,
+        process_var: Real,
+        nugget: Optional[Real] = None,
+    ) -> MogpHyperparameters:
+        """Create an instance without running the validation in ``__post_init__``.
+
+        This is for use only with hyperparameters that come from a trusted source and so
+        are known to be valid."""
+
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "corr_length_scales", corr_length_scales)
+        object.__setattr__(obj, "process_var", process_var)
+        object.__setattr__(obj, "nugget", nugget)
+        return obj
 
     def __eq__(self, other) -> bool:
         return isinstance(other, self.__class__) and super().__eq__(other)
@@ -760,18 +874,23 @@ class MogpHyperparameters(GaussianProcessHyperparameters):
                 "when this object's nugget is None."
             )
 
-        transformed_params = [self.transform_corr(x) for x in self.corr_length_scales] + [
-            self.transform_cov(self.process_var)
-        ]
+        # Transform all the correlation length scales in one go; these are known to be
+        # positive from validation at initialisation.
+        corr = np.asarray(self.corr_length_scales, dtype=float)
+        n_corr = corr.size
+        transformed_params = np.empty(n_corr + 1 + (nugget_type == "fit"), dtype=float)
+        np.log(corr, out=transformed_params[:n_corr])
+        transformed_params[:n_corr] *= -2
+        transformed_params[n_corr] = self.transform_cov(self.process_var)
 
         if nugget_type == "fixed":
-            params = GPParams(n_corr=len(self.corr_length_scales), nugget=self.nugget)
+            params = GPParams(n_corr=n_corr, nugget=self.nugget)
         elif nugget_type == "fit":
-            transformed_params.append(self.transform_nugget(self.nugget))
-            params = GPParams(n_corr=len(self.corr_length_scales), nugget="fit")
+            transformed_params[-1] = self.transform_nugget(self.nugget)
+            params = GPParams(n_corr=n_corr, nugget="fit")
         else:
-            params = GPParams(n_corr=len(self.corr_length_scales), nugget=nugget_type)
+            params = GPParams(n_corr=n_corr, nugget=nugget_type)
 
-        params.set_data(np.array(transformed_params, dtype=float))
+        params.set_data(transformed_params)
 
         return params
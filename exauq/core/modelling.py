@@ -10,7 +10,7 @@ import math
 import sys
 import warnings
 from collections import defaultdict
-from collections.abc import Collection, Mapping, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from itertools import product
 from numbers import Real
 from types import GenericAlias
@@ -330,10 +330,26 @@ class Input(Sequence):
     3
     """
 
+    # A slot is reserved for a level, so that a level can still be attached with
+    # `set_level`.
+    __slots__ = ("_value", "_dim", LevelTagged.level_attr)
+
     def __init__(self, *args: Real):
         self._value = self._unpack_args(self._validate_args(args))
         self._dim = len(args)
 
+    @classmethod
+    def _unchecked(cls, *args: Real) -> "Input":
+        """Create an input without validating the coordinates.
+
+        This is for use only with coordinates that are already known to be finite real
+        numbers."""
+
+        obj = object.__new__(cls)
+        obj._value = cls._unpack_args(args)
+        obj._dim = len(args)
+        return obj
+
     @staticmethod
     def _unpack_args(args: tuple[Any, ...]) -> Union[tuple[Any, ...], Any, None]:
         """Return items from a sequence of arguments, simplifying where
@@ -464,6 +480,11 @@ class Input(Sequence):
 
         return self._dim
 
+    def __iter__(self) -> Iterator[Real]:
+        """Iterates over the coordinates of this input."""
+
+        return iter(self._value or ())
+
     def __getitem__(self, item: Union[int, slice]) -> Union["Input", Real]:
         """Gets the coordinate at the given index of this input, or returns a new
         `Input` built from the given slice of coordinate entries."""
@@ -596,6 +617,48 @@ class TrainingDatum(object):
             cls(Input.from_array(input), output) for input, output in zip(inputs, outputs)
         ]
 
+    @staticmethod
+    def arrays_from_list(
+        data: Sequence["TrainingDatum"],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Create Numpy arrays of inputs and outputs from a sequence of training data.
+
+        This is the inverse of `list_from_arrays`: the inputs of the training data are
+        stacked into a 2-dimensional array (with a row for each input) and the outputs
+        into a 1-dimensional array. All inputs in `data` are expected to have the same
+        number of coordinates.
+
+        Parameters
+        ----------
+        data : Sequence[TrainingDatum]
+            A sequence of training data.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            A pair ``(inputs, outputs)`` of float arrays, where `inputs` has shape
+            ``(n, d)`` and `outputs` has shape ``(n,)``, with ``n`` the number of
+            training data and ``d`` the number of input coordinates.
+
+        Raises
+        ------
+        ValueError
+            If the inputs in `data` do not all have the same number of coordinates.
+        """
+
+        n = len(data)
+        dim = len(data[0].input) if n > 0 else 0
+        if any(len(datum.input) != dim for datum in data):
+            raise ValueError(
+                "Expected all inputs in 'data' to have the same number of coordinates."
+            )
+
+        inputs = np.fromiter(
+            (x for datum in data for x in datum.input), dtype=np.float64, count=n * dim
+        ).reshape(n, dim)
+        outputs = np.fromiter((datum.output for datum in data), dtype=np.float64, count=n)
+        return inputs, outputs
+
     @classmethod
     def read_from_csv(
         cls, path: Path, output_col: int = -1, header: bool = False
@@ -1893,45 +1956,77 @@ class GaussianProcessHyperparameters(AbstractHyperparameters):
                 f"received {type(self.corr_length_scales)}."
             )
 
-        nonpositive_corrs = [
-            x for x in self.corr_length_scales if not isinstance(x, Real) or x <= 0
-        ]
-        if nonpositive_corrs:
-            nonpositive_element = nonpositive_corrs[0]
+        if (idx := self._find_nonpositive(self.corr_length_scales)) is not None:
+            nonpositive_element = self.corr_length_scales[idx]
             raise ValueError(
                 "Expected 'corr_length_scales' to be a sequence or Numpy array of "
                 "positive real numbers, but found element "
                 f"{nonpositive_element} of type {type(nonpositive_element)}."
             )
 
-        validation.check_real(
-            self.process_var,
-            TypeError(
+        # Note: checking for floats first avoids the comparatively slow isinstance check
+        # against the Real ABC in the common case, and the error is only constructed if
+        # it needs raising.
+        process_var = self.process_var
+        if type(process_var) is not float and not isinstance(process_var, Real):
+            raise TypeError(
                 "Expected 'process_var' to be a real number, but received "
-                f"{type(self.process_var)}."
-            ),
-        )
-        if self.process_var <= 0:
+                f"{type(process_var)}."
+            )
+
+        if process_var <= 0:
             raise ValueError(
                 "Expected 'process_var' to be a positive real number, but received "
-                f"{self.process_var}."
+                f"{process_var}."
             )
 
-        if self.nugget is not None:
-            if not isinstance(self.nugget, Real):
+        nugget = self.nugget
+        if nugget is not None:
+            if type(nugget) is not float and not isinstance(nugget, Real):
                 raise TypeError(
-                    f"Expected 'nugget' to be a real number, but received {type(self.nugget)}."
+                    f"Expected 'nugget' to be a real number, but received {type(nugget)}."
                 )
 
-            if self.nugget < 0:
+            if nugget < 0:
                 raise ValueError(
-                    f"Expected 'nugget' to be a positive real number, but received {self.nugget}."
+                    f"Expected 'nugget' to be a positive real number, but received {nugget}."
                 )
 
+    @staticmethod
+    def _find_nonpositive(
+        corr_length_scales: Union[Sequence, np.ndarray]
+    ) -> Optional[int]:
+        """Return the index of the first element of the correlation length scales that is
+        not a positive real number, or ``None`` if there is no such element."""
+
+        # Numeric Numpy arrays only contain real numbers, so can be checked in one pass
+        if (
+            isinstance(corr_length_scales, np.ndarray)
+            and corr_length_scales.ndim == 1
+            and corr_length_scales.dtype.kind in "iuf"
+        ):
+            nonpositive = corr_length_scales <= 0
+            return int(np.argmax(nonpositive)) if nonpositive.any() else None
+
+        return next(
+            (
+                i
+                for i, x in enumerate(corr_length_scales)
+                if not isinstance(x, Real) or x <= 0
+            ),
+            None,
+        )
+
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, self.__class__):
             return False
 
+        if len(self.corr_length_scales) != len(other.corr_length_scales):
+            return False
+
         try:
             nuggets_equal = (
                 self.nugget is None and other.nugget is None
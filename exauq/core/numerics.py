@@ -1,7 +1,7 @@
 import math
 from collections.abc import Sequence
 from numbers import Real
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
@@ -40,13 +40,19 @@ def equal_within_tolerance(
     rel_tol = rel_tol or FLOAT_TOLERANCE
     abs_tol = abs_tol or FLOAT_TOLERANCE
 
-    if _is_seq(x) and _is_seq(y):
+    # Check for floats first, to skip the slower abstract base class checks
+    if (type(x) is float and type(y) is float) or (
+        isinstance(x, Real) and isinstance(y, Real)
+    ):
+        return math.isclose(x, y, rel_tol=rel_tol, abs_tol=abs_tol)
+    elif _is_seq(x) and _is_seq(y):
+        if (arrays := _as_real_arrays(x, y)) is not None:
+            return _arrays_close(*arrays, rel_tol=rel_tol, abs_tol=abs_tol)
+
         return len(x) == len(y) and all(
             equal_within_tolerance(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
             for a, b in zip(x, y)
         )
-    elif isinstance(x, Real) and isinstance(y, Real):
-        return math.isclose(x, y, rel_tol=rel_tol, abs_tol=abs_tol)
     else:
         raise TypeError(
             "Both arguments must be composed of real numbers, or sequences / Numpy arrays "
@@ -58,6 +64,37 @@ def _is_seq(x) -> bool:
     return isinstance(x, (Sequence, np.ndarray))
 
 
+def _as_real_arrays(x, y) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """Convert two sequences to float Numpy arrays of the same shape, or return
+    ``None`` if they don't both define real-valued arrays of the same shape."""
+
+    try:
+        ax, ay = np.asarray(x), np.asarray(y)
+    except ValueError:
+        # Raised for ragged nested sequences
+        return None
+
+    if ax.shape != ay.shape or ax.dtype.kind not in "biuf" or ay.dtype.kind not in "biuf":
+        return None
+
+    return ax.astype(float, copy=False), ay.astype(float, copy=False)
+
+
+def _arrays_close(x: np.ndarray, y: np.ndarray, rel_tol: Real, abs_tol: Real) -> bool:
+    """Test whether all elements of two arrays are equal within tolerance, with the
+    same semantics as applying ``math.isclose`` element-wise."""
+
+    if rel_tol < 0 or abs_tol < 0:
+        raise ValueError("tolerances must be non-negative")
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        diff = np.abs(x - y)
+        tol = np.maximum(rel_tol * np.maximum(np.abs(x), np.abs(y)), abs_tol)
+        close = (x == y) | (np.isfinite(diff) & (diff <= tol))
+
+    return bool(close.all())
+
+
 def set_tolerance(tol: float):
     """
     Allows the updating of the global FLOAT_TOLERANCE from 1e-9 to the value
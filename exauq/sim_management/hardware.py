@@ -4,6 +4,7 @@ import pathlib
 import string
 import textwrap
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from enum import Enum
 from typing import Any, Optional, Union
 
@@ -103,6 +104,9 @@ class HardwareInterface(ABC):
     - get_job_output
     - cancel_job
 
+    Implementations that can retrieve the statuses of several jobs with a single request
+    to the hardware may also override `get_job_statuses`.
+
     Attributes:
     ----------
     name : str
@@ -134,6 +138,24 @@ class HardwareInterface(ABC):
     def get_job_status(self, job_id: JobId):
         raise NotImplementedError
 
+    def get_job_statuses(self, job_ids: Sequence[JobId]) -> dict[JobId, JobStatus]:
+        """Get the statuses of several jobs.
+
+        By default, this calls `get_job_status` for each job in turn.
+
+        Parameters
+        ----------
+        job_ids : Sequence[JobId]
+            The IDs of the jobs to get the statuses of.
+
+        Returns
+        -------
+        dict[JobId, JobStatus]
+            The status of each of the jobs, keyed by job ID.
+        """
+
+        return {job_id: self.get_job_status(job_id) for job_id in job_ids}
+
     @abstractmethod
     def get_job_output(self, job_id: JobId):
         raise NotImplementedError
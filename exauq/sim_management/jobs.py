@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+import sys
 from typing import Optional, Union
 
 from exauq.core.modelling import Input
@@ -20,13 +20,17 @@ class JobId:
         of ``JobId``.
     """
 
+    __slots__ = ("_job_id",)
+
     def __init__(self, job_id: Union[str, int, JobId]):
-        self._job_id = self._parse(job_id)
+        self._job_id = sys.intern(self._parse(job_id))
 
     @staticmethod
     def _parse(job_id) -> str:
         job_id_str = str(job_id)
-        if re.fullmatch("[0-9]+", job_id_str):
+
+        # Note: isdigit alone would also accept non-ASCII digits such as '²'
+        if job_id_str.isascii() and job_id_str.isdigit():
             return job_id_str
         else:
             raise ValueError(
@@ -74,6 +78,8 @@ class Job:
         (Read-only) The interface name of the job.
     """
 
+    __slots__ = ("_id", "_data", "_level", "_interface_name")
+
     def __init__(
         self,
         id_: Union[JobId, str, int],
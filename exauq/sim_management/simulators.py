@@ -1,7 +1,9 @@
+import bisect
 import csv
 import os
 import random
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Collection
 from datetime import datetime
 from numbers import Real
@@ -9,6 +11,9 @@ from threading import Event, Lock, Thread
 from time import sleep
 from typing import Any, Optional, Sequence, Union
 
+import numpy as np
+
+import exauq.core.numerics as numerics
 from exauq.core.modelling import AbstractSimulator, Input, MultiLevel, SimulatorDomain
 from exauq.sim_management.hardware import (
     PENDING_STATUSES,
@@ -107,7 +112,7 @@ class Simulator(AbstractSimulator):
         no output from the simulator has been retrieved, the output is recorded as
         ``None``.
         """
-        return tuple(self._simulations_log.get_simulations())
+        return self._simulations_log.get_simulations()
 
     def compute(self, x: Input) -> Optional[Real]:
         """
@@ -136,13 +141,59 @@ class Simulator(AbstractSimulator):
                 f"Argument 'x' must be of type Input, but received {type(x)}."
             )
 
-        for _input, output in self.previous_simulations:
-            if _input == x:
-                return output
+        if (simulation := self._simulations_log.lookup(x)) is not None:
+            return simulation[1]
 
         self._manager.submit(x)
         return None
 
+    def compute_many(self, inputs: Sequence[Input]) -> tuple[Optional[Real], ...]:
+        """
+        Submit several simulation inputs for computation.
+
+        This has the same effect as calling `compute` on each of the inputs in turn,
+        except that all never-before seen inputs are submitted for computation together,
+        so that they are recorded in the simulations log in one go. Inputs that are
+        repeated within `inputs`, up to the tolerance used for testing equality of
+        `Input` objects, are only submitted once.
+
+        Parameters
+        ----------
+        inputs : Sequence[Input]
+            Inputs for the simulator.
+
+        Returns
+        -------
+        tuple[Optional[Real], ...]
+            The result of computing each input, in the same order as `inputs`: ``None``
+            for a new input, or else the corresponding simulator output, if this has
+            previously been computed.
+        """
+
+        for x in inputs:
+            if not isinstance(x, Input):
+                raise TypeError(
+                    "Argument 'inputs' must only contain objects of type Input, but "
+                    f"received {type(x)}."
+                )
+
+        outputs = []
+        new_inputs = []
+        for x in inputs:
+            if (simulation := self._simulations_log.lookup(x)) is not None:
+                outputs.append(simulation[1])
+            else:
+                # Compare with Input equality, as for looking up inputs in the log
+                if not any(x == new_x for new_x in new_inputs):
+                    new_inputs.append(x)
+
+                outputs.append(None)
+
+        if new_inputs:
+            self._manager.submit_many(tuple(new_inputs))
+
+        return tuple(outputs)
+
 
 class SimulationsLog(object):
     """
@@ -182,6 +233,15 @@ class SimulationsLog(object):
         self._log_file = self._initialise_log_file(file)
         self._simulations_db = self._make_db(self._log_file, self._log_file_header)
 
+        # In-memory index of simulations for lookup by input, built on first use
+        self._simulations: Optional[list[Simulation]] = None
+        self._simulation_positions: dict[tuple[Real, ...], int] = {}
+        self._job_positions: dict[str, int] = {}
+
+        # First input coordinate and position of each simulation in the index, sorted,
+        # for finding simulations with inputs equal to a given one up to tolerance
+        self._first_coordinates: list[tuple[Real, int]] = []
+
     def _initialise_log_file(self, file: FilePath) -> FilePath:
         """Create a new simulations log file at the given path if it doesn't already exist
         and return the path."""
@@ -250,6 +310,37 @@ class SimulationsLog(object):
         """Get the interface name of a job from a database record"""
         return record[self._interface_name_key]
 
+    def _retrieve_records(self, job_ids: Collection[str]) -> dict[str, Record]:
+        """Get the first record in the log file for each of the given job IDs, keyed by
+        job ID. Job IDs without a record are omitted."""
+
+        job_ids = frozenset(job_ids)
+        records = {}
+        for record in self._simulations_db.query(
+            lambda x: self._get_job_id(x) in job_ids
+        ):
+            records.setdefault(self._get_job_id(record), record)
+
+        return records
+
+    def _write_updates(
+        self,
+        updates: dict[str, dict[str, Any]],
+        records: Optional[dict[str, Record]] = None,
+    ) -> None:
+        """Update fields of existing job records, given as a mapping of job IDs to new
+        field values. The current records for the job IDs can be supplied if they have
+        already been retrieved, otherwise they are retrieved from the log file. Should be
+        called with the lock held."""
+
+        if records is None:
+            records = self._retrieve_records(updates.keys())
+
+        self._simulations_db.update_many(
+            self._job_id_key,
+            {job_id: records[job_id] | fields for job_id, fields in updates.items()},
+        )
+
     def get_simulations(self) -> tuple[Simulation]:
         """
         Get all simulations contained in the log file.
@@ -265,25 +356,128 @@ class SimulationsLog(object):
             simulation output, or ``None`` if this hasn't yet been computed.
         """
         with self._lock:
-            return tuple(
-                self._extract_simulation(record)
-                for record in self._simulations_db.query()
-            )
+            records = self._simulations_db.query()
+
+        return self._extract_simulations(records)
+
+    def _extract_simulations(self, records: Sequence[Record]) -> tuple[Simulation, ...]:
+        """Extract pairs of simulator inputs and outputs from dictionary records read
+        from the log file, converting the input coordinates for all records at once.
+        Missing outputs are converted to ``None``."""
+
+        inputs = np.array(
+            [record[key] for record in records for key in self._input_keys], dtype=float
+        ).reshape(len(records), self._input_dim)
+
+        if not np.isfinite(inputs).all():
+            # Construct inputs one by one, to raise the appropriate error
+            return tuple(self._extract_simulation(record) for record in records)
+
+        outputs = (self._get_output(record) for record in records)
+        return tuple(
+            (Input._unchecked(*x), float(y) if y else None)
+            for x, y in zip(inputs.tolist(), outputs)
+        )
 
     def _extract_simulation(self, record: dict[str, str]) -> Simulation:
         """Extract a pair of simulator inputs and outputs from a dictionary record read
         from the log file. Missing outputs are converted to ``None``."""
 
-        input_items = sorted(
-            ((k, v) for k, v in record.items() if k.startswith("Input")),
-            key=lambda x: x[0],
-        )
-        input_coords = (float(v) for _, v in input_items)
-        x = Input(*input_coords)
+        x = Input(*(float(record[key]) for key in self._input_keys))
         output = self._get_output(record)
         y = float(output) if output else None
         return x, y
 
+    def lookup(self, x: Input) -> Optional[Simulation]:
+        """
+        Find a simulation in the log file with a given input.
+
+        Inputs are compared in the same way as for testing equality of `Input` objects.
+        A simulation whose input has exactly the same coordinates as `x` is preferred:
+        if there is one, then the first such simulation recorded in the log file is
+        returned. Otherwise, the first simulation recorded in the log file with input
+        equal to `x` up to numerical tolerance is returned. (So a simulation with an
+        exactly matching input is returned even if a simulation recorded before it has
+        an input that is only equal to `x` within tolerance.)
+
+        Lookups are served from an in-memory index of the log file, which is built on
+        the first call to this method and then kept up to date with records added or
+        updated through this `SimulationsLog`. Changes made to the log file by other
+        means after the index is built are not reflected in the lookup. Looking for an
+        input equal to `x` up to tolerance only compares `x` with the inputs whose first
+        coordinate is within tolerance of that of `x`, so lookups don't slow down as the
+        log grows unless many inputs share nearly the same first coordinate.
+
+        Parameters
+        ----------
+        x : Input
+            The simulator input to look up.
+
+        Returns
+        -------
+        Optional[tuple[Input, Optional[Real]]]
+            The simulation ``(x, y)`` with input equal to `x`, where ``y`` is the
+            simulation output or ``None`` if this hasn't yet been computed. If there is
+            no simulation in the log file with input `x` then ``None`` is returned.
+        """
+
+        with self._lock:
+            if self._simulations is None:
+                self._build_simulations_index()
+
+            position = self._simulation_positions.get(tuple(x))
+            if position is None:
+                position = self._find_position_within_tolerance(x)
+
+            return self._simulations[position] if position is not None else None
+
+    def _find_position_within_tolerance(self, x: Input) -> Optional[int]:
+        """Find the position in the index of the first simulation with input equal to
+        `x` up to numerical tolerance, or ``None`` if there is no such simulation. Should
+        be called with the lock held."""
+
+        if len(x) != self._input_dim:
+            return None
+
+        # Coordinates equal up to tolerance differ by at most twice the tolerance (scaled
+        # by the size of the coordinate), so only simulations with first coordinate in
+        # this window need comparing. Otherwise compare with every simulation.
+        tol = numerics.FLOAT_TOLERANCE
+        if tol <= 0.5:
+            width = 2 * tol * max(abs(x[0]), 1)
+            start = bisect.bisect_left(self._first_coordinates, (x[0] - width,))
+            stop = bisect.bisect_right(self._first_coordinates, (x[0] + width, np.inf))
+            positions = sorted(i for _, i in self._first_coordinates[start:stop])
+        else:
+            positions = range(len(self._simulations))
+
+        return next((i for i in positions if self._simulations[i][0] == x), None)
+
+    def _build_simulations_index(self) -> None:
+        """Build the in-memory index of simulations from the records in the log file."""
+
+        records = self._simulations_db.query()
+        self._simulations = list(self._extract_simulations(records))
+        self._simulation_positions = {}
+        for position, (x, _) in enumerate(self._simulations):
+            self._simulation_positions.setdefault(tuple(x), position)
+
+        self._job_positions = {
+            self._get_job_id(record): position for position, record in enumerate(records)
+        }
+        self._first_coordinates = sorted(
+            (x[0], position) for position, (x, _) in enumerate(self._simulations)
+        )
+
+    def _index_simulation(self, job_id: str, simulation: Simulation) -> None:
+        """Add a simulation to the end of the in-memory index of simulations."""
+
+        position = len(self._simulations)
+        self._simulations.append(simulation)
+        self._simulation_positions.setdefault(tuple(simulation[0]), position)
+        self._job_positions[job_id] = position
+        bisect.insort(self._first_coordinates, (simulation[0][0], position))
+
     def add_new_record(
         self,
         x: Input,
@@ -334,17 +528,93 @@ class SimulationsLog(object):
             if existing_record:
                 raise ValueError(f"The job_id '{job_id}' is already in use.")
 
-            record = {h: "" for h in self._log_file_header}
-            record = {
-                **record,
-                **dict(zip(self._input_keys, x)),
+            record = self._make_record(x, job_id, job_status, job_level, interface_name)
+            self._simulations_db.create(record)
+            if self._simulations is not None:
+                self._index_simulation(str(job_id), self._extract_simulation(record))
+
+    def _make_record(
+        self,
+        x: Input,
+        job_id: JobId,
+        job_status: JobStatus,
+        job_level: int,
+        interface_name: Optional[str],
+    ) -> dict[str, str]:
+        """Make a database record for a new simulation job."""
+
+        record = dict(zip(self._input_keys, x))
+        record.update(
+            {
+                self._output_key: "",
                 self._job_id_key: str(job_id),
                 self._job_status_key: job_status.value,
                 self._job_level_key: str(job_level),
                 self._interface_name_key: interface_name or "",
             }
+        )
+        return record
 
-            self._simulations_db.create(record)
+    def add_new_records(
+        self, jobs: Sequence[Job], job_status: JobStatus = JobStatus.PENDING_SUBMIT
+    ) -> None:
+        """
+        Record several new simulation jobs in the log file.
+
+        This is equivalent to calling `add_new_record` for each job in turn, except that
+        the new records are written to the log file in one go. All jobs are checked
+        before any are recorded, so that either all jobs are added to the log or none
+        are.
+
+        Parameters
+        ----------
+        jobs : Sequence[Job]
+            The jobs to record. The input, job ID, level and interface name of each job
+            are recorded in the log.
+        job_status : JobStatus, optional
+            The status to record against each of the jobs. Defaults to
+            JobStatus.PENDING_SUBMIT.
+
+        Raises
+        ------
+        ValueError
+            - If the input of any of the jobs does not have the expected number of
+              coordinates.
+            - If the ID of any of the jobs is already in use, or is repeated within
+              `jobs`.
+        """
+        with self._lock:
+            for job in jobs:
+                if len(job.data) != self._input_dim:
+                    raise ValueError(
+                        f"Expected input 'x' to have {self._input_dim} coordinates, but "
+                        f"got {len(job.data)} instead."
+                    )
+
+            used_ids = set(
+                self._simulations_db.retrieve_many(
+                    self._job_id_key, [str(job.id) for job in jobs]
+                )
+            )
+            for job in jobs:
+                job_id = str(job.id)
+                if job_id in used_ids:
+                    raise ValueError(f"The job_id '{job_id}' is already in use.")
+
+                used_ids.add(job_id)
+
+            records = [
+                self._make_record(
+                    job.data, job.id, job_status, job.level, job.interface_name
+                )
+                for job in jobs
+            ]
+            self._simulations_db.create_many(records)
+            if self._simulations is not None:
+                for record in records:
+                    self._index_simulation(
+                        self._get_job_id(record), self._extract_simulation(record)
+                    )
 
     def insert_result(self, job_id: Union[str, JobId], result: Real) -> None:
         """Insert the output of a simulation into a job record in the simulations log
@@ -363,19 +633,71 @@ class SimulationsLog(object):
             If there isn't a log record having job ID `job_id`.
         """
 
-        job_id_str = str(job_id)
+        self.insert_results([(job_id, result)])
 
+    def insert_results(
+        self,
+        results: Sequence[tuple[Union[str, JobId], Optional[Real]]],
+        job_status: Optional[JobStatus] = None,
+    ) -> None:
+        """Insert the outputs of several simulations into job records in the simulations
+        log file.
+
+        This is equivalent to calling `insert_result` for each job ID and result in
+        turn, except that the log file is updated in one go. Optionally, the status of
+        each of the jobs can be updated at the same time. All job IDs are checked before
+        any results are inserted, so that either all records are updated or none are.
+
+        Parameters
+        ----------
+        results : Sequence[tuple[Union[str, JobId], Optional[Real]]]
+            Pairs of job IDs and the simulation outputs that should be added to the
+            records for these jobs.
+        job_status : Optional[JobStatus], optional
+            (Default: None) If not ``None``, the status to record against each of the
+            jobs, in addition to the outputs.
+
+        Raises
+        ------
+        SimulationsLogLookupError
+            If there isn't a log record for one of the job IDs in `results`.
+        """
+
+        updated_fields = {self._job_status_key: job_status.value} if job_status else {}
         with self._lock:
-            record = self._simulations_db.retrieve(self._job_id_key, job_id_str)
-            if record:
-                new_record = record | {self._output_key: result}
-                self._simulations_db.update(self._job_id_key, job_id_str, new_record)
-            else:
-                msg = (
-                    f"Could not add output to simulation with job ID = {job_id_str}: "
-                    "no such simulation exists."
+            records = self._retrieve_records(str(job_id) for job_id, _ in results)
+            new_records = {}
+            for job_id, result in results:
+                job_id_str = str(job_id)
+                if job_id_str not in records:
+                    msg = (
+                        f"Could not add output to simulation with job ID = {job_id_str}: "
+                        "no such simulation exists."
+                    )
+                    raise SimulationsLogLookupError(msg)
+
+                new_records[job_id_str] = (
+                    records[job_id_str] | updated_fields | {self._output_key: result}
                 )
-                raise SimulationsLogLookupError(msg)
+
+            self._write_updates(
+                {
+                    job_id: updated_fields
+                    | {self._output_key: new_record[self._output_key]}
+                    for job_id, new_record in new_records.items()
+                },
+                records,
+            )
+
+            if self._simulations is not None:
+                for job_id_str, new_record in new_records.items():
+                    if (position := self._job_positions.get(job_id_str)) is not None:
+                        self._simulations[position] = self._extract_simulation(
+                            {
+                                k: "" if v is None else str(v)
+                                for k, v in new_record.items()
+                            }
+                        )
 
     def get_records(
         self,
@@ -383,28 +705,31 @@ class SimulationsLog(object):
         statuses: Sequence[JobStatus] = None,
     ) -> list[dict[str, Any]]:
         """Return records based on given job ids and job status codes"""
-        with self._lock:
-            job_ids_str = (
-                [str(job_id) for job_id in job_ids] if job_ids is not None else None
-            )
 
+        # Compare raw strings from the log, so that only matching records need parsing
+        job_ids_str = (
+            frozenset(str(job_id) for job_id in job_ids) if job_ids is not None else None
+        )
+        status_values = (
+            frozenset(status.value for status in statuses)
+            if statuses is not None
+            else None
+        )
+        with self._lock:
             records = self._simulations_db.query(
-                lambda x: (statuses is None or self._get_job_status(x) in statuses)
-                and (job_ids_str is None or str(self._get_job_id(x)) in job_ids_str)
+                lambda x: (job_ids_str is None or self._get_job_id(x) in job_ids_str)
+                and (status_values is None or x[self._job_status_key] in status_values)
             )
 
-        job_records = []
-        for record in records:
-            simulation = self._extract_simulation(record)
-            job_record = {
+        return [
+            {
                 "job_id": JobId(self._get_job_id(record)),
                 "status": self._get_job_status(record),
-                "input": simulation[0],
-                "output": simulation[1],
+                "input": x,
+                "output": y,
             }
-            job_records.append(job_record)
-
-        return job_records
+            for record, (x, y) in zip(records, self._extract_simulations(records))
+        ]
 
     def get_non_terminated_jobs(self) -> tuple[Job, ...]:
         """Return all jobs which don't have results and have a non-terminal status.
@@ -490,8 +815,10 @@ class SimulationsLog(object):
         with self._lock:
             record = self._simulations_db.retrieve(self._job_id_key, job_id_str)
             if record:
-                new_record = record | {self._job_status_key: new_status.value}
-                self._simulations_db.update(self._job_id_key, job_id_str, new_record)
+                self._write_updates(
+                    {job_id_str: {self._job_status_key: new_status.value}},
+                    {job_id_str: record},
+                )
             else:
                 msg = (
                     f"Could not update status of simulation with job ID = {job_id_str}: "
@@ -594,6 +921,8 @@ class JobManager:
         are executed.
     polling_interval : int, optional
         Time interval, in seconds, for polling job statuses during monitoring. Defaults to 10 seconds.
+        Polling temporarily happens more often after job statuses have changed, backing
+        off to this interval when statuses stay the same.
     wait_for_pending : bool, optional
         Specifies whether the manager should wait for all pending jobs to reach a
         conclusive status (e.g., COMPLETED or FAILED) upon initialization. Defaults to False.
@@ -603,6 +932,8 @@ class JobManager:
     submit(x: Input, level: int = 1) -> Job
         Submits a new simulation job based on the provided simulation input. Handles initial job
         logging and sets status to PENDING_SUBMIT.
+    submit_many(inputs: Sequence[Input], level: int = 1) -> tuple[Job, ...]
+        Submits several new simulation jobs, recording them in the simulations log in one go.
     monitor(jobs: list[Job])
         Initiates or resumes monitoring of job statuses in a separate background thread.
     cancel(job_id: JobId) -> Job
@@ -639,6 +970,10 @@ class JobManager:
     monitoring threads.
     """
 
+    _MAX_BACKOFF_STEPS = 3
+    """The number of times the wait between polling cycles is doubled on the way back
+    up to the full polling interval."""
+
     def __init__(
         self,
         simulations_log: SimulationsLog,
@@ -653,7 +988,7 @@ class JobManager:
         self._name_index = self._create_name_index(interfaces)
 
         self._polling_interval = polling_interval
-        self._monitored_jobs = []
+        self._monitored_jobs: dict[JobId, Job] = {}
         self._lock = Lock()
         self._thread = None
         self._shutdown_event = Event()
@@ -715,6 +1050,61 @@ class JobManager:
 
         return job
 
+    def submit_many(self, inputs: Sequence[Input], level: int = 1) -> tuple[Job, ...]:
+        """
+        Submits several new simulation jobs at once.
+
+        This has the same effect as calling `submit` for each of the inputs in turn,
+        except that the new jobs are recorded in the simulations log in one go. Jobs are
+        spread across the hardware interfaces for the given level in the same way as for
+        repeated calls to `submit`.
+
+        Parameters
+        ----------
+        inputs : Sequence[Input]
+            The input data for the simulation jobs.
+        level : int, optional
+            The level of the jobs. Defaults to 1.
+
+        Returns
+        -------
+        tuple[Job, ...]
+            The initialised and logged Job objects, in the same order as the `inputs`.
+            This is empty if `inputs` is empty.
+
+        Raises
+        ------
+        TypeError
+            If any of the `inputs` is not an `Input`.
+
+        Examples
+        --------
+        >>> jobs = job_manager.submit_many([Input(0.0, 1.0), Input(2.0, 3.0)])
+        >>> print([job.id for job in jobs])
+        """
+
+        for x in inputs:
+            if not isinstance(x, Input):
+                raise TypeError(
+                    "Argument 'inputs' must only contain objects of type Input, but "
+                    f"received {type(x)}."
+                )
+
+        if not inputs:
+            return ()
+
+        interface_names = self._select_interfaces(level, len(inputs))
+        generate_id = self._id_generator.generate_id
+        jobs = tuple(
+            Job(generate_id(), x, level, interface_name)
+            for x, interface_name in zip(inputs, interface_names)
+        )
+
+        self._simulations_log.add_new_records(jobs, job_status=JobStatus.PENDING_SUBMIT)
+        self.monitor(jobs)
+
+        return jobs
+
     @staticmethod
     def _validate_interfaces(interfaces: Sequence[HardwareInterface]):
         """Check that the supplied argument is a sequence of hardware interfaces and that
@@ -760,18 +1150,29 @@ class JobManager:
         """Selects a hardware interface for a job based on the level and the number of jobs
         assigned to each interface."""
 
+        return self._select_interfaces(level, 1)[0]
+
+    def _select_interfaces(self, level: int, n_jobs: int) -> list[str]:
+        """Selects hardware interfaces for several jobs of the same level, spreading the
+        jobs across interfaces as if each were assigned in turn."""
+
         with self._lock:
             matching_interfaces = self._interfaces.get(level, None)
 
             if not matching_interfaces:
                 raise ValueError(f"No interfaces found for level {level}")
 
-            interface_name = min(
-                matching_interfaces,
-                key=lambda interface: self._interface_job_monitor_counts[interface.name],
-            ).name
+            counts = {
+                interface.name: self._interface_job_monitor_counts[interface.name]
+                for interface in matching_interfaces
+            }
+            interface_names = []
+            for _ in range(n_jobs):
+                interface_name = min(counts, key=counts.get)
+                counts[interface_name] += 1
+                interface_names.append(interface_name)
 
-            return interface_name
+            return interface_names
 
     def cancel(self, job_id: JobId) -> Job:
         """Cancels a job with the given ID.
@@ -794,7 +1195,8 @@ class JobManager:
             If the job has already terminated and so cannot be cancelled.
         """
         with self._lock:
-            jobs_to_cancel = [job for job in self._monitored_jobs if job.id == job_id]
+            job = self._monitored_jobs.get(job_id)
+            jobs_to_cancel = [job] if job is not None else []
 
         if not jobs_to_cancel:
             # If here then the job is no longer being monitored, i.e. has terminated, so
@@ -859,38 +1261,90 @@ class JobManager:
         """
 
         with self._lock:
-            self._monitored_jobs.extend(jobs)
             for job in jobs:
-                self._interface_job_monitor_counts[job.interface_name] += 1
+                if job.id not in self._monitored_jobs:
+                    self._interface_job_monitor_counts[job.interface_name] += 1
+
+                self._monitored_jobs[job.id] = job
         if self._thread is None or not self._thread.is_alive():
             self._shutdown_event.clear()
             self._thread = Thread(target=self._monitor_jobs)
             self._thread.start()
 
     def _monitor_jobs(self):
-        """Continuously monitor the status of jobs and handle their completion."""
+        """Continuously monitor the status of jobs and handle their completion.
 
+        After a polling cycle in which the status of some job changed, the wait before
+        the next cycle is cut to a fraction of the polling interval, then doubled after
+        each quiet cycle until it is back to the full polling interval."""
+
+        quiet_cycles = self._MAX_BACKOFF_STEPS
+        previous_statuses = {}
         while self._monitored_jobs and not self._shutdown_event.is_set():
-            if self._shutdown_event.wait(timeout=self._polling_interval):
+            wait = self._polling_interval / 2 ** (self._MAX_BACKOFF_STEPS - quiet_cycles)
+            if self._shutdown_event.wait(timeout=wait):
                 return
 
             with self._lock:
-                jobs = self._monitored_jobs[:]
+                jobs = list(self._monitored_jobs.values())
+
+            statuses = self._get_job_statuses(jobs)
+            if statuses is None:
+                return
 
+            # Status changes are written to the simulations log as soon as jobs are
+            # handled, so that e.g. a submitted job is never left recorded as pending
+            # submission. Outputs of completed jobs are inserted in one go.
+            completed_jobs = []
             for job in jobs:
                 if self._shutdown_event.is_set():
                     return
 
-                status = self._simulations_log.get_job_status(job.id)
-                is_pending_or_failed_submit = status in PENDING_STATUSES | {
-                    JobStatus.FAILED_SUBMIT
-                }
+                # A job left out by its hardware interface has an unknown status, so
+                # is retried on the next cycle.
+                status = statuses.get(job.id)
+                if status is None:
+                    continue
+                elif status == JobStatus.COMPLETED:
+                    completed_jobs.append(job)
+                else:
+                    self._handle_job(job, status)
+
+            if completed_jobs:
+                self._handle_jobs(completed_jobs, JobStatus.COMPLETED)
+
+            if any(
+                status != previous_statuses.get(job_id, status)
+                for job_id, status in statuses.items()
+            ):
+                quiet_cycles = 0
+            else:
+                quiet_cycles = min(quiet_cycles + 1, self._MAX_BACKOFF_STEPS)
+
+            previous_statuses = statuses
+
+    def _get_job_statuses(self, jobs: Sequence[Job]) -> Optional[dict[JobId, JobStatus]]:
+        """Get the current statuses of jobs, making one request per hardware interface
+        for jobs that have been submitted. Returns ``None`` if shutdown is requested
+        part way through."""
+
+        statuses = {}
+        submitted_job_ids = defaultdict(list)
+        for job in jobs:
+            status = self._simulations_log.get_job_status(job.id)
+            if status in PENDING_STATUSES | {JobStatus.FAILED_SUBMIT}:
+                statuses[job.id] = status
+            else:
+                submitted_job_ids[job.interface_name].append(job.id)
+
+        for interface_name, job_ids in submitted_job_ids.items():
+            if self._shutdown_event.is_set():
+                return None
 
-                if not is_pending_or_failed_submit:
-                    interface = self.get_interface(job.interface_name)
-                    status = interface.get_job_status(job.id)
+            interface = self.get_interface(interface_name)
+            statuses.update(interface.get_job_statuses(job_ids))
 
-                self._handle_job(job, status)
+        return statuses
 
     def get_interface(self, interface_name: str) -> HardwareInterface:
         """Get the hardware interface with the given name.
@@ -946,8 +1400,8 @@ class JobManager:
         """
 
         with self._lock:
-            if job in self._monitored_jobs:
-                self._monitored_jobs.remove(job)
+            if self._monitored_jobs.get(job.id) == job:
+                del self._monitored_jobs[job.id]
                 self._interface_job_monitor_counts[job.interface_name] -= 1
 
     def shutdown(self):
@@ -985,6 +1439,14 @@ class JobManager:
         if strategy:
             strategy.handle(job, self)
 
+    def _handle_jobs(self, jobs: Sequence[Job], status: JobStatus):
+        """Delegates handling of several jobs with the same status to the appropriate
+        strategy."""
+
+        strategy = self._job_strategies.get(status)
+        if strategy:
+            strategy.handle_many(jobs, self)
+
 
 class JobStrategy(ABC):
     """
@@ -999,6 +1461,9 @@ class JobStrategy(ABC):
     handle(job: Job, job_manager: JobManager)
         Executes the strategy's actions for a given job within the context of the provided
         job manager.
+    handle_many(jobs: Sequence[Job], job_manager: JobManager)
+        Executes the strategy's actions for several jobs within the context of the
+        provided job manager.
     """
 
     @staticmethod
@@ -1026,6 +1491,25 @@ class JobStrategy(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @classmethod
+    def handle_many(cls, jobs: Sequence[Job], job_manager: JobManager):
+        """
+        Handle several jobs according to the strategy's specific actions.
+
+        By default, each job is handled in turn with `handle`. Subclasses may override
+        this to handle the jobs together where that is more efficient.
+
+        Parameters
+        ----------
+        jobs : Sequence[Job]
+            The jobs to be handled.
+        job_manager : JobManager
+            The job manager instance, providing context and access to job management
+            functionalities.
+        """
+        for job in jobs:
+            cls.handle(job, job_manager)
+
 
 class CompletedJobStrategy(JobStrategy):
     """
@@ -1051,6 +1535,19 @@ class CompletedJobStrategy(JobStrategy):
         job_manager.simulations_log.update_job_status(str(job.id), JobStatus.COMPLETED)
         job_manager.remove_job(job)
 
+    @classmethod
+    def handle_many(cls, jobs: Sequence[Job], job_manager: JobManager):
+        results = []
+        for job in jobs:
+            interface = job_manager.get_interface(job.interface_name)
+            results.append((str(job.id), interface.get_job_output(job.id)))
+
+        job_manager.simulations_log.insert_results(
+            results, job_status=JobStatus.COMPLETED
+        )
+        for job in jobs:
+            job_manager.remove_job(job)
+
 
 class FailedJobStrategy(JobStrategy):
     """
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import itertools
+import locale
+import os
 import pathlib
-from collections.abc import Callable, Collection, Iterator
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
 from os import PathLike
 from typing import Any, Optional, Union
 
@@ -23,6 +28,14 @@ class CsvDB(object):
     If the csv file doesn't exist at the supplied path, then it will be created when
     adding the first record to the database via the `create()` method.
 
+    Records parsed from the csv file are cached between reads, so that repeated lookups
+    don't need to re-parse the file. Each read still reads the whole file and checks its
+    contents against a hash of those the cache was made from, so that changes made to
+    the file by other means are always picked up. This means that every read, including
+    one served from the cache, takes time proportional to the size of the file. Records
+    added or updated through the `CsvDB` instance are written to the cache as well as
+    the file.
+
     Parameters
     ----------
     path : str or os.PathLike
@@ -50,6 +63,12 @@ class CsvDB(object):
         self._path = pathlib.Path(path)
         self._fields_arg = "fields"  # should match the name of the argument in __init__
         self._fields = self._make_fields(fields)
+        self._fields_set = frozenset(self._fields)
+        self._cache: Optional[tuple[bytes, tuple[Record, ...], tuple[int, ...]]] = None
+
+        # Position of the first cached record having each value of a field, keyed by
+        # field; built on demand and kept in step with the cached records
+        self._indices: dict[str, dict[str, int]] = {}
 
     def _make_fields(self, fields: Collection[str]) -> None:
         """Make the fields to store reference in database operations.
@@ -79,12 +98,12 @@ class CsvDB(object):
                 f"Argument '{self._fields_arg}' contains repeated fields: {repeated_fields}."
             )
 
-        if not self._path.exists():
+        try:
+            with open(self._path, mode="r") as csvfile:
+                file_fields = tuple(csvfile.readline().strip().split(","))
+        except FileNotFoundError:
             return fields
 
-        with open(self._path, mode="r") as csvfile:
-            file_fields = tuple(csvfile.readline().strip().split(","))
-
         if self._any_missing(file_fields):
             raise MissingFieldsError(
                 f"Database file {self._path} contains empty field names."
@@ -133,20 +152,101 @@ class CsvDB(object):
         Raises
         ------
         ValueError
-            If the record is missing any of the fields of the database.
+            If the record is missing any of the fields of the database, or contains
+            fields not in the database.
         """
 
+        self.create_many([record])
+
+    def create_many(self, records: Collection[dict[str, Any]]) -> None:
+        """Add several new records to the underlying database csv file.
+
+        This behaves like calling `create()` on each record in turn, except that the
+        records are written to the csv file in one go. All records are checked before any
+        are written, so that either all records are added or none are.
+
+        Parameters
+        ----------
+        records : Collection[dict[str, Any]]
+            The records to write to the database, in the order they should be added. See
+            `create()` for details on the form of each record.
+
+        Raises
+        ------
+        ValueError
+            If any of the records is missing any of the fields of the database, or
+            contains fields not in the database.
+        """
+
+        for record in records:
+            self._check_record_fields(record)
+
+        if not records:
+            return None
+
+        rows = io.StringIO(newline="")
+        csv.writer(rows).writerows(
+            [record[field] for field in self._fields] for record in records
+        )
+        encoding = locale.getpreferredencoding(False)
+        data = rows.getvalue().encode(encoding)
+
+        with open(self._path, mode="a+b") as csvfile:
+            # Only check the cache against the current contents of the file if there is
+            # a cache that could be extended
+            contents = b""
+            cache_is_current = False
+            if self._cache is not None:
+                csvfile.seek(0)
+                contents = csvfile.read()
+                cache_is_current = self._cache[0] == self._signature(contents)
+
+            header = b""
+            if (offset := csvfile.seek(0, os.SEEK_END)) == 0:
+                header_row = io.StringIO(newline="")
+                csv.writer(header_row).writerow(self._fields)
+                header = header_row.getvalue().encode(encoding)
+                offset = len(header)
+
+            # Append the header, if needed, and the records in a single write
+            csvfile.write(header + data)
+
+        if cache_is_current:
+            signature = self._signature(contents + header + data)
+            # Extend the cached records with the new ones rather than re-reading the file
+            new_records, new_offsets = self._parse_lines(data, offset)
+            for field, index in self._indices.items():
+                for i, record in enumerate(new_records, start=len(self._cache[1])):
+                    index.setdefault(record[field], i)
+
+            self._cache = (
+                signature,
+                self._cache[1] + new_records,
+                self._cache[2] + new_offsets,
+            )
+        else:
+            self._cache = None
+            self._indices = {}
+
+    def _check_record_fields(self, record: dict[str, Any]) -> None:
+        """Check that a record contains exactly the fields of the database."""
+
+        if record.keys() == self._fields_set:
+            return None
+
         missing_fields = ", ".join([f"'{k}'" for k in self._fields if k not in record])
         if missing_fields:
             raise ValueError(
                 f"Argument 'record' missing the following fields: {missing_fields}."
             )
-        mode = "a" if self._path.exists() else "x"
-        with open(self._path, mode=mode, newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, self._fields)
-            if mode == "x":
-                writer.writeheader()
-            writer.writerow(record)
+
+        if len(record) > len(self._fields):
+            extra_fields = ", ".join(
+                [f"'{k}'" for k in record if k not in self._fields_set]
+            )
+            raise ValueError(
+                f"Argument 'record' contains fields not in the database: {extra_fields}."
+            )
 
     def retrieve(self, field: str, value: Any) -> Optional[Record]:
         """Retrieve the first record with a specified value for a field.
@@ -182,30 +282,150 @@ class CsvDB(object):
         finds with `field` set to `value`.
         """
 
+        return self.retrieve_many(field, [value]).get(str(value))
+
+    def retrieve_many(self, field: str, values: Collection[Any]) -> dict[str, Record]:
+        """Retrieve the first record with each of several values for a field.
+
+        This behaves like calling `retrieve()` for each value in turn, except that the
+        csv file is read once for all the values.
+
+        Parameters
+        ----------
+        field : str
+            The field against which to look up the given `values`.
+        values : Collection[Any]
+            The values to match on. These will be coverted to strings before performing
+            the lookup.
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            The first record whose value at the given `field` matches each value (after
+            string conversion, if necessary), keyed by the value as a string. Values for
+            which no record was found are omitted.
+
+        Raises
+        ------
+        DatabaseLookupError
+            If the field supplied does not exist in the database.
+        """
+
         self._validate_field(field)
-        if not self._path.exists():
-            return None
+        records, index = self._read_records(), self._get_index(field)
+        found = {}
+        for value in map(str, values):
+            if (position := index.get(value)) is not None:
+                found[value] = dict(records[position])
 
-        with open(self._path, mode="r", newline="") as csvfile:
-            reader = self._make_data_reader(csvfile)
-            for row in reader:
-                if row[field] == str(value):
-                    return row
+        return found
 
     def _validate_field(self, field: str) -> None:
         """Check that the given field is present in the database."""
 
-        if field not in self._fields:
+        if field not in self._fields_set:
             raise DatabaseLookupError(
                 f"'{field}' does not define a field in the database."
             )
 
-    def _make_data_reader(self, csvfile: Iterator[Record]) -> csv.DictReader:
-        """Make a reader that iterates through all non-header records."""
+    def _read_records(self) -> tuple[Record, ...]:
+        """Read all non-header records from the csv file, reusing the records from the
+        previous read if the file is unchanged since then.
+
+        The records returned are shared with the cache and so must not be modified."""
+
+        try:
+            contents = self._path.read_bytes()
+        except FileNotFoundError:
+            self._cache = None
+            self._indices = {}
+            return tuple()
 
-        reader = csv.DictReader(csvfile, self._fields)
-        _ = next(reader)
-        return reader
+        return self._use_contents(contents)
+
+    def _use_contents(self, contents: bytes) -> tuple[Record, ...]:
+        """Get the records from the given contents of the csv file, reusing the cached
+        records if they were parsed from the same contents and caching the records
+        otherwise."""
+
+        signature = self._signature(contents)
+        if self._cache is None or self._cache[0] != signature:
+            self._cache = (signature, *self._parse_lines(contents, has_header=True))
+            self._indices = {}
+
+        return self._cache[1]
+
+    def _get_index(self, field: str) -> dict[str, int]:
+        """Get a mapping of the values of a field to the position of the first cached
+        record having that value. Should be called after reading the records, so that
+        the cache is current."""
+
+        if (index := self._indices.get(field)) is None:
+            index = {}
+            for i, record in enumerate(self._cache[1] if self._cache else ()):
+                index.setdefault(record[field], i)
+
+            self._indices[field] = index
+
+        return index
+
+    @staticmethod
+    def _signature(contents: bytes) -> bytes:
+        """Make the signature used to tell whether the contents of the csv file have
+        changed since the cached records were parsed."""
+
+        return hashlib.blake2b(contents, digest_size=16).digest()
+
+    def _parse_lines(
+        self, data: bytes, start: int = 0, has_header: bool = False
+    ) -> tuple[tuple[Record, ...], tuple[int, ...]]:
+        """Parse records from a chunk of the csv file that starts at byte offset `start`,
+        along with the byte offset in the file at which each record starts."""
+
+        # Split on the same line endings as a file opened in text mode with
+        # ``newline=""``, keeping track of where each line starts.
+        lines = data.splitlines(keepends=True)
+        line_offsets = tuple(itertools.accumulate(map(len, lines), initial=start))
+        encoding = locale.getpreferredencoding(False)
+        reader = csv.reader(line.decode(encoding) for line in lines)
+        if has_header:
+            _ = next(reader, None)
+
+        records, offsets = [], []
+        for offset, row in self._iter_rows(reader, line_offsets):
+            records.append(self._make_record(row))
+            offsets.append(offset)
+
+        return tuple(records), tuple(offsets)
+
+    @staticmethod
+    def _iter_rows(
+        reader: Iterator[list[str]], line_offsets: Sequence[int]
+    ) -> Iterator[tuple[int, list[str]]]:
+        """Iterate through the non-blank rows from a csv reader, along with the byte
+        offset of the line on which each row starts."""
+
+        while True:
+            offset = line_offsets[reader.line_num]
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+
+            if row:
+                yield offset, row
+
+    def _make_record(self, row: list[str]) -> Record:
+        """Make a record from a row of the csv file, in the same way as
+        ``csv.DictReader``."""
+
+        record = dict(zip(self._fields, row))
+        if len(row) > len(self._fields):
+            record[None] = row[len(record) :]
+        elif len(row) < len(self._fields):
+            record.update((field, None) for field in self._fields if field not in record)
+
+        return record
 
     def query(
         self, predicate_fn: Optional[Callable[[Record], bool]] = None
@@ -234,17 +454,15 @@ class CsvDB(object):
             the database.
         """
 
-        if not self._path.exists():
-            return tuple()
-        with open(self._path, mode="r", newline="") as csvfile:
-            try:
-                return tuple(filter(predicate_fn, self._make_data_reader(csvfile)))
-            except KeyError as exc:
-                raise DatabaseLookupError(
-                    "Bad 'predicate_fn': attempted to look up a field not in the database."
-                ) from exc
-            except Exception as exc:
-                raise exc.__class__(f"Bad 'predicate_fn': {exc}") from exc
+        records = self._read_records()
+        try:
+            return tuple(dict(row) for row in filter(predicate_fn, records))
+        except KeyError as exc:
+            raise DatabaseLookupError(
+                "Bad 'predicate_fn': attempted to look up a field not in the database."
+            ) from exc
+        except Exception as exc:
+            raise exc.__class__(f"Bad 'predicate_fn': {exc}") from exc
 
     def update(self, field: str, value: Any, record: dict[str, Any]) -> None:
         """Update a record matching a given field/value combination.
@@ -284,20 +502,96 @@ class CsvDB(object):
         the first matching record it finds with `field` set to `value`.
         """
 
+        self.update_many(field, {value: record})
+
+    def update_many(self, field: str, records: Mapping[Any, dict[str, Any]]) -> None:
+        """Update several records matching given field/value combinations.
+
+        This behaves like calling `update()` for each value and record in turn, except
+        that the csv file is rewritten once for all the updates. All values are looked up
+        before any records are updated, so that either all records are updated or none
+        are.
+
+        Parameters
+        ----------
+        field : str
+            The field against which to look up the values when locating the records to
+            replace.
+        records : Mapping[Any, dict[str, Any]]
+            A mapping of values to match on to the new records with which to replace the
+            old records. See `update()` for details on how values are matched and the
+            form of the new records.
+
+        Raises
+        ------
+        DatabaseLookupError
+            If one of the following occurs:
+            * The field supplied does not exist in the database.
+            * A record cannot be found for one of the `field`/value combinations.
+        """
+
         self._validate_field(field)
-        records = list(self.query())
-        field_values = tuple(rec[field] for rec in records)
         try:
-            records[field_values.index(str(value))] = record
-        except ValueError as exc:
-            raise DatabaseLookupError(
-                f"Could not find record with {field} = {value}."
-            ) from exc
+            csvfile = open(self._path, mode="r+b")
+        except FileNotFoundError:
+            self._cache = None
+            self._indices = {}
+            _ = self._find_positions(field, records)
+            return None
+
+        with csvfile:
+            # Work from the current contents of the file, read through the same handle
+            # that is written to, so that the rewrite can't overwrite changes made to the
+            # file by other means since the records were last read
+            contents = csvfile.read()
+            current_records = self._use_contents(contents)
+            updates = self._find_positions(field, records)
+            if not updates:
+                return None
+
+            # Only the records from the first updated one onwards need rewriting
+            start = min(updates)
+            tail = io.StringIO(newline="")
+            writer = csv.DictWriter(tail, self._fields)
+            writer.writerows(
+                updates.get(i, current_records[i])
+                for i in range(start, len(current_records))
+            )
+
+            offsets = self._cache[2]
+            data = tail.getvalue().encode(locale.getpreferredencoding(False))
+            csvfile.seek(offsets[start])
+            csvfile.write(data)
+            csvfile.truncate()
+
+        # Replace the cached records from the first updated one onwards, rather than
+        # re-reading the file
+        new_records, new_offsets = self._parse_lines(data, offsets[start])
+        self._cache = (
+            self._signature(contents[: offsets[start]] + data),
+            current_records[:start] + new_records,
+            offsets[:start] + new_offsets,
+        )
+        self._indices = {}
+
+    def _find_positions(
+        self, field: str, records: Mapping[Any, dict[str, Any]]
+    ) -> dict[int, dict[str, Any]]:
+        """Map the position of the cached record to replace to the new record, for each
+        value and new record in `records`. Should be called after reading the records, so
+        that the cache is current."""
+
+        index = self._get_index(field)
+        positions = {}
+        for value, record in records.items():
+            try:
+                positions[index[str(value)]] = record
+            except KeyError as exc:
+                raise DatabaseLookupError(
+                    f"Could not find record with {field} = {value}."
+                ) from exc
 
-        with open(self._path, mode="w", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, self._fields)
-            writer.writeheader()
-            writer.writerows(records)
+        return positions
 
 
 class FieldsMismatchError(Exception):
@@ -499,3 +499,14 @@ class DumbJobManager:
             The simulator input to record.
         """
         self._simulations_log.add_new_record(x)
+
+    def submit_many(self, inputs: Sequence[Input]) -> None:
+        """Submit several inputs to be recorded in the log.
+
+        Parameters
+        ----------
+        inputs : Sequence[Input]
+            The simulator inputs to record.
+        """
+        for x in inputs:
+            self._simulations_log.add_new_record(x)
@@ -1,3 +1,5 @@
+import csv
+import functools
 import os
 import pathlib
 import tempfile
@@ -12,58 +14,75 @@ from exauq.utilities.csv_db import (
     Path,
     RepeatedFieldsError,
 )
+from tests.utilities.utilities import exact
 
 
-def exact(string: str):
-    """Turn a string into a regular expressions that defines an exact match on the
-    string.
-    """
-    escaped = string
-    for char in ["\\", "(", ")"]:
-        escaped = escaped.replace(char, "\\" + char)
+def write_csv(path: Path, rows: Iterable[Iterable[str]]):
+    """Write rows of data to a new csv file in one go, with each row comma-separated."""
+    with open(path, mode="x", newline="") as f:
+        csv.writer(f, lineterminator="\n").writerows(rows)
 
-    return "^" + escaped + "$"
 
-
-def write_csv_row(path: Path, data: Iterable[str], mode="x"):
-    """Write data to a csv file as a comma-separated row."""
-    with open(path, mode=mode, newline="") as f:
-        f.write(",".join(data) + "\n")
+def write_bytes(path: Path, data: bytes):
+    """Write data to a new file."""
+    with open(path, mode="xb") as f:
+        f.write(data)
 
 
 class TestCsvDB(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Fields and records to add to databases
+        cls.pkey = "id"
+        cls.col1 = "col1"
+        cls.fields = [cls.pkey, cls.col1]
+        cls.record = {cls.pkey: "1", cls.col1: "a"}
+        cls.record2 = {cls.pkey: "2", cls.col1: "b"}
+        cls.record3 = {cls.pkey: "3", cls.col1: cls.record[cls.col1]}
+
+        # Contents of the populated database files, rendered once and copied for each
+        # test
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir, "db.csv")
+            CsvDB(path, cls.fields).create_many([cls.record, cls.record2])
+            cls._db2_bytes = path.read_bytes()
+            CsvDB(path, cls.fields).create(cls.record3)
+            cls._db4_bytes = path.read_bytes()
+
     def setUp(self) -> None:
         # Temp directory for holding csv file during a unit test run
         self._dir = tempfile.TemporaryDirectory()
         self.tmp_dir = self._dir.name
 
-        # An empty database with fields and record to add to it
+        # An empty database
         self.path = os.path.join(self.tmp_dir, "db.csv")
-        self.pkey = "id"
-        self.col1 = "col1"
-        self.fields = [self.pkey, self.col1]
         self.db = CsvDB(self.path, self.fields)
-        self.record = {self.pkey: "1", self.col1: "a"}
 
         # Database with two records in it
-        self.path2 = pathlib.Path(self.tmp_dir, "db2.csv")
-        self.db2 = CsvDB(self.path2, self.fields)
-        self.record2 = {self.pkey: "2", self.col1: "b"}
-        self.db2.create(self.record)
-        self.db2.create(self.record2)
+        self.path2 = os.path.join(self.tmp_dir, "db2.csv")
 
         # Database where order of fields differs from that of the underlying file
         self.path3 = os.path.join(self.tmp_dir, "db3.csv")
-        write_csv_row(self.path3, self.fields)
-        self.dbrev = CsvDB(self.path3, list(reversed(self.fields)))
 
         # Database with three records in it, where some repeat values for a column
         self.path4 = os.path.join(self.tmp_dir, "db4.csv")
-        self.db4 = CsvDB(self.path4, self.fields)
-        self.record3 = {self.pkey: "3", self.col1: self.record[self.col1]}
-        self.db4.create(self.record)
-        self.db4.create(self.record2)
-        self.db4.create(self.record3)
+
+    # The databases other than `db` are only made in the tests that use them
+
+    @functools.cached_property
+    def db2(self) -> CsvDB:
+        write_bytes(self.path2, self._db2_bytes)
+        return CsvDB(self.path2, self.fields)
+
+    @functools.cached_property
+    def dbrev(self) -> CsvDB:
+        write_csv(self.path3, [self.fields])
+        return CsvDB(self.path3, list(reversed(self.fields)))
+
+    @functools.cached_property
+    def db4(self) -> CsvDB:
+        write_bytes(self.path4, self._db4_bytes)
+        return CsvDB(self.path4, self.fields)
 
     def tearDown(self) -> None:
         self._dir.cleanup()
@@ -72,39 +91,45 @@ class TestCsvDB(unittest.TestCase):
         """Test that a database can be initialised on an existing csv file having
         the correct fields."""
 
-        write_csv_row(self.path, self.fields)
+        write_csv(self.path, [self.fields])
         _ = CsvDB(self.path, self.fields)
 
+    def test_initialise_with_pathlib_path(self):
+        """Test that a database can be initialised with a path given as a
+        ``pathlib.Path`` object."""
+
+        db = CsvDB(pathlib.Path(self.path), self.fields)
+        db.create(self.record)
+        self.assertEqual((self.record,), db.query())
+
     def test_initialise_existing_file_fields_have_diff_order(self):
         """Test that a database can be initialised on an existing csv file having
         the correct fields but in a different order to those supplied."""
 
-        write_csv_row(self.path, reversed(self.fields))
+        write_csv(self.path, [reversed(self.fields)])
         _ = CsvDB(self.path, self.fields)
 
-    def test_initialise_empty_fields_error(self):
-        """Test that a ValueError is raised if an empty collection of fields is provided."""
-
-        with self.assertRaisesRegex(
-            ValueError, exact("Argument 'fields' defines an empty collection.")
-        ):
-            _ = CsvDB(self.path, [])
-
-    def test_initialise_empty_field_names_error(self):
-        """Test that a ValueError is raised if a collection of fields is provided that
-        contains empty field names."""
+    def test_initialise_invalid_fields_error(self):
+        """Test that a ValueError is raised if the fields supplied at initialisation
+        define an empty collection, contain empty field names or contain repeats."""
 
-        with self.assertRaisesRegex(
-            ValueError,
-            exact("Argument 'fields' contains empty field names."),
-        ):
-            _ = CsvDB(self.path, ["a", ""])
+        for fields, msg in [
+            ([], "Argument 'fields' defines an empty collection."),
+            (["a", ""], "Argument 'fields' contains empty field names."),
+            (
+                ["a", "a", "b", "b", "c"],
+                "Argument 'fields' contains repeated fields: 'a', 'b'.",
+            ),
+        ]:
+            with self.subTest(fields=fields):
+                with self.assertRaisesRegex(ValueError, exact(msg)):
+                    _ = CsvDB(self.path, fields)
 
     def test_initialise_existing_file_empty_field_names_error(self):
         """Test that a MissingFieldsError is raised if a database is initialised on an
         existing csv file that contains empty field names."""
 
-        write_csv_row(self.path, ["a", ""])
+        write_csv(self.path, [["a", ""]])
         with self.assertRaisesRegex(
             MissingFieldsError,
             exact(f"Database file {self.path} contains empty field names."),
@@ -116,28 +141,18 @@ class TestCsvDB(unittest.TestCase):
         on an existing csv file which contains repeated fields."""
 
         fields = ["a", "b", "c"]
-        write_csv_row(self.path, ["a", "a", "b", "b", "c"])
+        write_csv(self.path, [["a", "a", "b", "b", "c"]])
         with self.assertRaisesRegex(
             RepeatedFieldsError,
             exact(f"Database file {self.path} contains repeated fields: 'a', 'b'."),
         ):
             _ = CsvDB(self.path, fields)
 
-    def test_initialise_repeated_fields_error(self):
-        """Test that a ValueError is raised if the fields supplied at
-        initialisation contain repeats."""
-
-        with self.assertRaisesRegex(
-            ValueError,
-            exact("Argument 'fields' contains repeated fields: 'a', 'b'."),
-        ):
-            _ = CsvDB(self.path, ["a", "a", "b", "b", "c"])
-
     def test_initialise_existing_file_wrong_header_error(self):
         """Test that an FieldsMismatchError is raised if a database is initialised on
         an existing csv file that has a different header to the one specified."""
 
-        write_csv_row(self.path, ["a", "b"])
+        write_csv(self.path, [["a", "b"]])
         with self.assertRaisesRegex(
             FieldsMismatchError,
             exact(f"'fields' does not agree with the fields defined in {self.path}."),
@@ -170,50 +185,86 @@ class TestCsvDB(unittest.TestCase):
             self.db.retrieve(self.pkey, record[self.pkey]),
         )
 
-    def test_create_error_missing_field(self):
+    def test_create_error_missing_fields(self):
         """Test that a ValueError is raised if the record submitted for creation has
-        a field missing."""
+        one or more fields missing."""
 
         record = {self.pkey: "1"}
+        for db, missing in [
+            (self.db, "'col1'"),
+            (CsvDB(self.path, ["a", "b"]), "'a', 'b'"),
+        ]:
+            with self.subTest(missing=missing):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    exact(f"Argument 'record' missing the following fields: {missing}."),
+                ):
+                    db.create(record)
+
+    def test_create_error_extra_fields(self):
+        """Test that a ValueError is raised and no record is added if the record
+        submitted for creation has fields not in the database."""
+
+        record = self.record | {"a": "x"}
         with self.assertRaisesRegex(
-            ValueError, "^Argument 'record' missing the following fields: 'col1'.$"
+            ValueError,
+            exact("Argument 'record' contains fields not in the database: 'a'."),
         ):
             self.db.create(record)
 
-    def test_create_error_missing_fields_multiple(self):
-        """Test that a ValueError is raised if the record submitted for creation has
-        multiple fields missing."""
-
-        db = CsvDB(self.path, ["a", "b"])
-        record = {self.pkey: "1"}
-        with self.assertRaisesRegex(
-            ValueError, "^Argument 'record' missing the following fields: 'a', 'b'.$"
-        ):
-            db.create(record)
+        self.assertEqual(tuple(), self.db.query())
 
     def test_create_multiple_records(self):
         """Test that multiple records can be added to the database sequentially."""
 
-        record2 = {self.pkey: "2", self.col1: "b"}
         self.db.create(self.record)
-        self.db.create(record2)
-        for record in [self.record, record2]:
+        self.db.create(self.record2)
+        for record in [self.record, self.record2]:
             self.assertEqual(record, self.db.retrieve(self.pkey, record[self.pkey]))
 
     def test_create_multiple_records_csv_content(self):
         """Test that the csv file has the expected content when multple records are
         created sequentially."""
 
-        record2 = {self.pkey: "2", self.col1: "b"}
         self.db.create(self.record)
-        self.db.create(record2)
+        self.db.create(self.record2)
+        expected = "".join(
+            ",".join(row) + "\n"
+            for row in [self.fields, self.record.values(), self.record2.values()]
+        )
         with open(self.path, mode="r", newline=None) as csvfile:
-            expected = (
-                [",".join(self.fields) + "\n"]
-                + [",".join([self.record[self.pkey], self.record[self.col1]]) + "\n"]
-                + [",".join([record2[self.pkey], record2[self.col1]]) + "\n"]
-            )
-            self.assertEqual(expected, csvfile.readlines())
+            self.assertEqual(expected, csvfile.read())
+
+    def test_create_many_csv_content(self):
+        """Test that the csv file has the same content when multiple records are created
+        together as when they are created sequentially."""
+
+        self.db.create_many([self.record, self.record2])
+        expected = "".join(
+            ",".join(row) + "\n"
+            for row in [self.fields, self.record.values(), self.record2.values()]
+        )
+        with open(self.path, mode="r", newline=None) as csvfile:
+            self.assertEqual(expected, csvfile.read())
+
+    def test_create_many_no_records_written_if_missing_field(self):
+        """Test that a ValueError is raised and no records are added if any of the
+        records is missing a field of the database."""
+
+        with self.assertRaisesRegex(
+            ValueError,
+            exact(f"Argument 'record' missing the following fields: '{self.col1}'."),
+        ):
+            self.db2.create_many([{self.pkey: "3", self.col1: "c"}, {self.pkey: "4"}])
+
+        self.assertEqual((self.record, self.record2), self.db2.query())
+
+    def test_create_many_no_records(self):
+        """Test that creating an empty collection of records leaves the database
+        unchanged."""
+
+        self.db.create_many([])
+        self.assertFalse(os.path.exists(self.path))
 
     def test_create_add_record_to_existing_file(self):
         """Test that a record can be added to an existing database file when
@@ -224,11 +275,10 @@ class TestCsvDB(unittest.TestCase):
 
         # Create new database from same file and add record
         db = CsvDB(self.path, self.fields)
-        record2 = {self.pkey: "2", self.col1: "b"}
-        db.create(record2)
+        db.create(self.record2)
 
         self.assertEqual(self.record, db.retrieve(self.pkey, self.record[self.pkey]))
-        self.assertEqual(record2, db.retrieve(self.pkey, record2[self.pkey]))
+        self.assertEqual(self.record2, db.retrieve(self.pkey, self.record2[self.pkey]))
 
     def test_create_add_records_to_existing_file_fields_have_diff_order(self):
         """Test that a record can be added to a database in which the fields are in a
@@ -248,7 +298,7 @@ class TestCsvDB(unittest.TestCase):
     def test_retrieve_no_records_in_db(self):
         """Test that no record is returned when the database has no records in it."""
 
-        write_csv_row(self.path, self.fields)
+        write_csv(self.path, [self.fields])
         self.assertEqual(None, self.db.retrieve(self.pkey, "1"))
 
     def test_retrieve_no_record_return_none(self):
@@ -258,26 +308,39 @@ class TestCsvDB(unittest.TestCase):
         self.db.create(self.record)
         self.assertIsNone(self.db.retrieve(self.pkey, self.pkey))
 
-    def test_retrieve_missing_field_error(self):
-        """Test that a DatabaseLookupError is raised if the field provided does not match
-        a field in the database."""
+    def test_retrieve_first_matching_record_after_creating_records(self):
+        """Test that retrieving records after more are created still returns the first
+        record with the given field value, including for newly created records."""
 
-        field = "not-present"
-        with self.assertRaisesRegex(
-            DatabaseLookupError,
-            exact(f"'{field}' does not define a field in the database."),
-        ):
-            self.db2.retrieve(field, "1")
+        self.assertEqual(
+            self.record, self.db4.retrieve(self.col1, self.record[self.col1])
+        )
+
+        record4 = {self.pkey: "4", self.col1: "d"}
+        self.db4.create_many(
+            [{self.pkey: "5", self.col1: self.record[self.col1]}, record4]
+        )
+        self.assertEqual(
+            self.record, self.db4.retrieve(self.col1, self.record[self.col1])
+        )
+        self.assertEqual(record4, self.db4.retrieve(self.col1, record4[self.col1]))
+
+    def test_retrieve_after_file_deleted_return_none(self):
+        """Test that ``None`` is returned if the csv file behind the database is deleted
+        after records have been retrieved."""
+
+        _ = self.db2.retrieve(self.pkey, self.record[self.pkey])
+        os.remove(self.path2)
+        self.assertIsNone(self.db2.retrieve(self.pkey, self.record[self.pkey]))
 
     def test_retrieve_field_order_in_file_differs_to_instantiation(self):
         """Test that a record can be correctly retrieved when it belongs to a csv file
         where the order of fields differs from that given at instantiation of a new
         database."""
 
-        write_csv_row(self.path3, ["1", "a"], mode="a")
-        self.assertEqual(
-            {self.pkey: "1", self.col1: "a"}, self.dbrev.retrieve(self.pkey, "1")
-        )
+        write_csv(self.path, [self.fields, ["1", "a"]])
+        db = CsvDB(self.path, list(reversed(self.fields)))
+        self.assertEqual({self.pkey: "1", self.col1: "a"}, db.retrieve(self.pkey, "1"))
 
     def test_update_replaces_correct_record(self):
         """Test that the record with the specified field value gets updated and no other
@@ -286,11 +349,27 @@ class TestCsvDB(unittest.TestCase):
         lookup_val = self.record2[self.pkey]
         updated_record = {self.pkey: lookup_val, self.col1: "c"}
         self.db2.update(self.pkey, lookup_val, updated_record)
-        self.assertEqual(updated_record, self.db2.retrieve(self.pkey, lookup_val))
-        self.assertEqual(
-            self.record, self.db2.retrieve(self.pkey, self.record[self.pkey])
+        self.assertEqual((self.record, updated_record), self.db2.query())
+
+    def test_update_record_of_different_length_keeps_other_records(self):
+        """Test that updating a record with a value of a different length to the
+        original leaves the records before and after it intact, including when the
+        database file uses non-default line endings."""
+
+        write_csv(
+            self.path,
+            [self.fields]
+            + [r.values() for r in (self.record, self.record2, self.record3)],
         )
 
+        updated_record = {self.pkey: self.record2[self.pkey], self.col1: "a longer value"}
+        self.db.update(self.pkey, self.record2[self.pkey], updated_record)
+        self.assertEqual((self.record, updated_record, self.record3), self.db.query())
+
+        updated_record = {self.pkey: self.record2[self.pkey], self.col1: ""}
+        self.db.update(self.pkey, self.record2[self.pkey], updated_record)
+        self.assertEqual((self.record, updated_record, self.record3), self.db.query())
+
     def test_update_replaces_record_convert_value_to_str(self):
         """Test that the record with the specified field value gets updated after
         converting the value to a string."""
@@ -311,17 +390,6 @@ class TestCsvDB(unittest.TestCase):
             new_record, self.dbrev.retrieve(self.pkey, new_record[self.pkey])
         )
 
-    def test_update_missing_field_error(self):
-        """Test that a DatabaseLookupError is raised if the field provided does not match
-        a field in the database."""
-
-        field = "not-present"
-        with self.assertRaisesRegex(
-            DatabaseLookupError,
-            exact(f"'{field}' does not define a field in the database."),
-        ):
-            self.db2.update(field, "1", self.record)
-
     def test_update_cannot_find_record_error(self):
         """Test that a DatabaseLookupError is raised if the key/value combination supplied to
         update cannot be found in the database."""
@@ -338,7 +406,7 @@ class TestCsvDB(unittest.TestCase):
         database. (Also tests that the header row is not included in the search when
         updating.)"""
 
-        write_csv_row(self.path, self.fields)
+        write_csv(self.path, [self.fields])
         val = self.pkey
         with self.assertRaisesRegex(
             DatabaseLookupError,
@@ -346,6 +414,52 @@ class TestCsvDB(unittest.TestCase):
         ):
             self.db.update(self.pkey, val, self.record)
 
+    def test_update_many_replaces_correct_records(self):
+        """Test that the records with the specified field values get updated and no other
+        records get updated."""
+
+        updated_record1 = {self.pkey: self.record[self.pkey], self.col1: "x"}
+        updated_record3 = {self.pkey: self.record3[self.pkey], self.col1: "z"}
+        self.db4.update_many(
+            self.pkey,
+            {
+                self.record3[self.pkey]: updated_record3,
+                int(self.record[self.pkey]): updated_record1,
+            },
+        )
+        self.assertEqual(
+            (updated_record1, self.record2, updated_record3), self.db4.query()
+        )
+
+    def test_update_many_no_records_updated_if_one_not_found(self):
+        """Test that no records are updated if one of the values cannot be found in the
+        database."""
+
+        updated_record = {self.pkey: self.record[self.pkey], self.col1: "x"}
+        with self.assertRaisesRegex(
+            DatabaseLookupError,
+            exact(f"Could not find record with {self.pkey} = 99."),
+        ):
+            self.db4.update_many(
+                self.pkey, {self.record[self.pkey]: updated_record, "99": self.record}
+            )
+
+        self.assertEqual((self.record, self.record2, self.record3), self.db4.query())
+
+    def test_records_updated_after_reading_match_file_contents(self):
+        """Test that, after successive updates to a database that has been read, the
+        records returned are the same as when read afresh from the csv file."""
+
+        _ = self.db4.query()
+        self.db4.update(
+            self.pkey, self.record2[self.pkey], {self.pkey: 2, self.col1: None}
+        )
+        self.db4.update(
+            self.pkey, self.record[self.pkey], {self.pkey: "1", self.col1: "x\ny"}
+        )
+
+        self.assertEqual(CsvDB(self.path4, self.fields).query(), self.db4.query())
+
     def test_query_no_file(self):
         """Test that no records are returned by the query if the database csv file hasn't
         been created yet."""
@@ -355,16 +469,9 @@ class TestCsvDB(unittest.TestCase):
     def test_query_no_records_in_db(self):
         """Test that no records are returned when the database has no records in it."""
 
-        write_csv_row(self.path, self.fields)
+        write_csv(self.path, [self.fields])
         self.assertEqual(tuple(), self.db.query())
 
-    def test_query_no_arg_return_all_records(self):
-        """Test that all records from the database are returned when no predicate
-        function is supplied."""
-
-        expected = (self.record, self.record2)
-        self.assertEqual(expected, self.db2.query())
-
     def test_query_existing_file_fields_have_diff_order(self):
         """Test that records are returned when the fields in the database file are in a
         different order to those supplied at initialisation."""
@@ -372,6 +479,141 @@ class TestCsvDB(unittest.TestCase):
         self.dbrev.create(self.record)
         self.assertEqual((self.record,), self.dbrev.query())
 
+    def test_query_sees_records_written_by_another_instance(self):
+        """Test that records added to the database file by another CsvDB instance are
+        returned when querying, after the database has previously been read."""
+
+        _ = self.db2.query()
+        other_db = CsvDB(self.path2, self.fields)
+        record3 = {self.pkey: "3", self.col1: "c"}
+        other_db.create(record3)
+
+        self.assertEqual((self.record, self.record2, record3), self.db2.query())
+
+    def test_query_sees_same_size_change_with_same_modification_time(self):
+        """Test that a change to the database file that keeps its size and modification
+        time is picked up when querying, after the database has previously been read."""
+
+        _ = self.db2.query()
+        stat = os.stat(self.path2)
+        contents = pathlib.Path(self.path2).read_bytes()
+        pathlib.Path(self.path2).write_bytes(contents.replace(b"1,a", b"1,z"))
+        os.utime(self.path2, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(
+            {self.pkey: "1", self.col1: "z"}, self.db2.retrieve(self.pkey, "1")
+        )
+
+    def test_update_keeps_same_size_change_with_same_modification_time(self):
+        """Test that updating a record keeps a change made to another record in the
+        database file that kept the file's size and modification time, after the
+        database has previously been read."""
+
+        _ = self.db2.query()
+        stat = os.stat(self.path2)
+        contents = pathlib.Path(self.path2).read_bytes()
+        pathlib.Path(self.path2).write_bytes(contents.replace(b"2,b", b"2,z"))
+        os.utime(self.path2, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        new_record = {self.pkey: "1", self.col1: "x"}
+        self.db2.update(self.pkey, "1", new_record)
+        self.assertEqual(
+            (new_record, {self.pkey: "2", self.col1: "z"}),
+            CsvDB(self.path2, self.fields).query(),
+        )
+
+    def test_records_created_after_reading_match_file_contents(self):
+        """Test that records created after the database has been read are returned in
+        the same form as when read afresh from the csv file, and can then be updated."""
+
+        _ = self.db2.query()
+        record3 = {self.pkey: 3, self.col1: "c\nd"}
+        record4 = {self.pkey: "4", self.col1: None}
+        self.db2.create_many([record3, record4])
+
+        self.assertEqual(CsvDB(self.path2, self.fields).query(), self.db2.query())
+
+        new_record3 = {self.pkey: "3", self.col1: "e"}
+        self.db2.update(self.pkey, "3", new_record3)
+        expected = (
+            self.record,
+            self.record2,
+            new_record3,
+            {self.pkey: "4", self.col1: ""},
+        )
+        self.assertEqual(expected, CsvDB(self.path2, self.fields).query())
+
+
+class TestCsvDBReadOnly(unittest.TestCase):
+    """Tests that only read from databases, which share fixtures built once for the
+    class."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Temp directory for holding csv files during the unit test run
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.tmp_dir = cls._dir.name
+
+        cls.pkey = "id"
+        cls.col1 = "col1"
+        cls.fields = [cls.pkey, cls.col1]
+        cls.record = {cls.pkey: "1", cls.col1: "a"}
+        cls.record2 = {cls.pkey: "2", cls.col1: "b"}
+        cls.record3 = {cls.pkey: "3", cls.col1: cls.record[cls.col1]}
+
+        # Database with two records in it
+        cls.path2 = os.path.join(cls.tmp_dir, "db2.csv")
+        cls.db2 = CsvDB(cls.path2, cls.fields)
+        cls.db2.create_many([cls.record, cls.record2])
+
+        # Database with three records in it, where some repeat values for a column
+        cls.path4 = os.path.join(cls.tmp_dir, "db4.csv")
+        cls.db4 = CsvDB(cls.path4, cls.fields)
+        cls.db4.create_many([cls.record, cls.record2, cls.record3])
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._dir.cleanup()
+
+    def test_missing_field_errors(self):
+        """Test that a DatabaseLookupError is raised, and no records are changed, if the
+        field provided to look up records does not match a field in the database."""
+
+        field = "not-present"
+        for op, call in [
+            ("retrieve", lambda: self.db2.retrieve(field, "1")),
+            ("retrieve_many", lambda: self.db2.retrieve_many(field, ["1"])),
+            ("update", lambda: self.db2.update(field, "1", self.record2)),
+            ("update_many", lambda: self.db2.update_many(field, {"1": self.record2})),
+        ]:
+            with self.subTest(op=op):
+                with self.assertRaisesRegex(
+                    DatabaseLookupError,
+                    exact(f"'{field}' does not define a field in the database."),
+                ):
+                    call()
+
+        self.assertEqual((self.record, self.record2), self.db2.query())
+
+    def test_retrieve_many_first_matching_records(self):
+        """Test that retrieving several values returns the first record with each value,
+        keyed by the value as a string, omitting values without a matching record."""
+
+        self.assertEqual(
+            {self.record[self.col1]: self.record, self.record2[self.col1]: self.record2},
+            self.db4.retrieve_many(
+                self.col1, [self.record[self.col1], self.record2[self.col1], "z"]
+            ),
+        )
+        self.assertEqual({"1": self.record}, self.db4.retrieve_many(self.pkey, [1]))
+
+    def test_query_no_arg_return_all_records(self):
+        """Test that all records from the database are returned when no predicate
+        function is supplied."""
+
+        expected = (self.record, self.record2)
+        self.assertEqual(expected, self.db2.query())
+
     def test_query_predicate_fn(self):
         """Test that a supplied predicate function is applied as a filter when querying."""
 
@@ -407,6 +649,16 @@ class TestCsvDB(unittest.TestCase):
         with self.assertRaisesRegex(Exception, "^Bad 'predicate_fn': "):
             self.db4.query(not_callable)
 
+    def test_query_modifying_returned_records_does_not_change_database(self):
+        """Test that modifying records returned from a query does not change the records
+        returned by subsequent lookups."""
+
+        records = self.db2.query()
+        records[0][self.col1] = "z"
+
+        self.assertEqual((self.record, self.record2), self.db2.query())
+        self.assertEqual(self.record, self.db2.retrieve(self.pkey, "1"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,6 @@
 import itertools
 import math
 import unittest.mock
-from numbers import Real
 
 import mogp_emulator as mogp
 import numpy as np
@@ -18,37 +17,58 @@ from tests.utilities.utilities import ExauqTestCase, exact
 
 
 class TestMogpEmulator(ExauqTestCase):
-    def setUp(self) -> None:
-        # Some default args to use for constructing mogp GaussianProcess objects
-        self.inputs_arr = np.array(
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Some default args to use for constructing mogp GaussianProcess objects. These
+        # are shared between tests, so are made read-only to guard against mutation.
+        cls.inputs_arr = np.array(
             [[0, 0], [0.2, 0.1], [0.3, 0.5], [0.7, 0.4], [0.9, 0.8]]
         )
-        self.targets_arr = np.array([1, 2, 3.1, 9, 2])
+        cls.inputs_arr.setflags(write=False)
+        cls.targets_arr = np.array([1, 2, 3.1, 9, 2])
+        cls.targets_arr.setflags(write=False)
 
-        self.inputs3 = [Input(1, 1), Input(2, 2), Input(3, 3)]
-        self.inputs4 = [Input(10, 10), Input(20, 20)]
+        # Training data corresponding to the above arrays
+        cls.arrays_training_data = tuple(
+            TrainingDatum.list_from_arrays(cls.inputs_arr, cls.targets_arr)
+        )
 
-        # kwargs for constructing an mogp GuassianProcess object
-        self.gp_kwargs = {
-            "mean": None,
-            "kernel": "Matern52",  # non-default
-            "priors": None,
-            "nugget": "pivot",  # non-default
-            "inputdict": {},
-            "use_patsy": False,  # non-default
-        }
+        cls.inputs3 = (Input(1, 1), Input(2, 2), Input(3, 3))
+        cls.inputs4 = (Input(10, 10), Input(20, 20))
 
         # Default training data for fitting an emulator
-        self.training_data = [
+        cls.training_data = (
             TrainingDatum(Input(0, 0), 1),
             TrainingDatum(Input(0.2, 0.1), 2),
             TrainingDatum(Input(0.3, 0.5), 3),
             TrainingDatum(Input(0.7, 0.4), 4),
             TrainingDatum(Input(0.9, 0.8), 5),
-        ]
+        )
 
         # Input not contained in training data, for making predictions
-        self.x = Input(0.1, 0.1)
+        cls.x = Input(0.1, 0.1)
+
+        # Hyperparameters estimated directly with mogp for the default arrays, to serve
+        # as a reference when checking hyperparameter estimation by the emulator.
+        gp = mogp.fit_GP_MAP(mogp.GaussianProcess(cls.inputs_arr, cls.targets_arr))
+        cls.reference_hyperparameters = MogpHyperparameters.from_mogp_gp_params(gp.theta)
+
+        # An emulator fit to the default training data with estimated hyperparameters.
+        # Fitting is comparatively expensive, so this is shared by tests that only
+        # make predictions and must not be refit or otherwise modified.
+        cls.fitted_emulator = MogpEmulator()
+        cls.fitted_emulator.fit(cls.training_data)
+
+    def setUp(self) -> None:
+        # kwargs for constructing an mogp GuassianProcess object
+        self.gp_kwargs = {
+            "mean": None,
+            "kernel": "Matern52",  # non-default
+            "priors": None,
+            "nugget": "pivot",  # non-default
+            "inputdict": {},
+            "use_patsy": False,  # non-default
+        }
 
     def assertAlmostBetween(self, x, lower, upper, **kwargs) -> None:
         """Checks whether a number lies between bounds up to a tolerance.
@@ -481,27 +501,17 @@ class TestMogpEmulator(ExauqTestCase):
         """Test that fitting the emulator results in the underlying GP being fit
         with hyperparameter estimation."""
 
-        gp = mogp.fit_GP_MAP(mogp.GaussianProcess(self.inputs_arr, self.targets_arr))
+        reference = self.reference_hyperparameters
         emulator = MogpEmulator()
-        emulator.fit(TrainingDatum.list_from_arrays(self.inputs_arr, self.targets_arr))
+        emulator.fit(self.arrays_training_data)
 
-        # Note: need to use allclose because fitting is not deterministic.
+        # Note: need to use a tolerance because fitting is not deterministic. The
+        # hyperparameters are flattened so they can be compared in a single check.
+        fitted = emulator.fit_hyperparameters
         tolerance = 1e-5
         self.assertEqualWithinTolerance(
-            gp.theta.corr,
-            emulator.fit_hyperparameters.corr_length_scales,
-            rel_tol=tolerance,
-            abs_tol=tolerance,
-        )
-        self.assertEqualWithinTolerance(
-            gp.theta.cov,
-            emulator.fit_hyperparameters.process_var,
-            rel_tol=tolerance,
-            abs_tol=tolerance,
-        )
-        self.assertEqualWithinTolerance(
-            gp.theta.nugget,
-            emulator.fit_hyperparameters.nugget,
+            [*reference.corr_length_scales, reference.process_var, reference.nugget],
+            [*fitted.corr_length_scales, fitted.process_var, fitted.nugget],
             rel_tol=tolerance,
             abs_tol=tolerance,
         )
@@ -511,9 +521,7 @@ class TestMogpEmulator(ExauqTestCase):
         and its training_data property is updated."""
 
         emulator = MogpEmulator()
-        training_data = tuple(
-            TrainingDatum.list_from_arrays(self.inputs_arr, self.targets_arr)
-        )
+        training_data = self.arrays_training_data
         emulator.fit(training_data)
 
         self.assertEqualWithinTolerance(self.inputs_arr, emulator.gp.inputs)
@@ -543,12 +551,10 @@ class TestMogpEmulator(ExauqTestCase):
         """Test that fitting the emulator respects bounds on hyperparameters
         when these are supplied."""
 
-        gp = mogp.fit_GP_MAP(mogp.GaussianProcess(self.inputs_arr, self.targets_arr))
-
         # Compute bounds to apply, by creating small windows away from known
         # optimal values of the hyperparameters.
-        corr = gp.theta.corr
-        cov = gp.theta.cov
+        corr = self.reference_hyperparameters.corr_length_scales
+        cov = self.reference_hyperparameters.process_var
         bounds = (
             (0.8 * corr[0], 0.9 * corr[0]),
             (0.8 * corr[1], 0.9 * corr[1]),
@@ -557,7 +563,7 @@ class TestMogpEmulator(ExauqTestCase):
 
         emulator = MogpEmulator()
         emulator.fit(
-            TrainingDatum.list_from_arrays(self.inputs_arr, self.targets_arr),
+            self.arrays_training_data,
             hyperparameter_bounds=bounds,
         )
         actual_corr = emulator.gp.theta.corr
@@ -579,7 +585,7 @@ class TestMogpEmulator(ExauqTestCase):
         in estimation."""
 
         emulator = MogpEmulator()
-        training_data = TrainingDatum.list_from_arrays(self.inputs_arr, self.targets_arr)
+        training_data = self.arrays_training_data
         emulator.fit(training_data)
         corr = emulator.fit_hyperparameters.corr_length_scales
         cov = emulator.fit_hyperparameters.process_var
@@ -613,6 +619,23 @@ class TestMogpEmulator(ExauqTestCase):
 
         self.assertEqual(self.gp_kwargs["nugget"], emulator.gp.nugget_type)
 
+    def test_fit_with_given_nugget_keeps_construction_nugget(self):
+        """Test that fitting with hyperparameters that include a nugget does not change
+        the nugget fitting method given at construction, so that later fits behave as
+        if the earlier fit had not happened."""
+
+        emulator = MogpEmulator(nugget="fit")
+        emulator.fit(
+            self.training_data,
+            hyperparameters=MogpHyperparameters([0.5, 0.4], 2, nugget=1.0),
+        )
+        hyperparameters = MogpHyperparameters([0.5, 0.4], 2)
+        with self.assertRaises(ValueError):
+            emulator.fit(self.training_data, hyperparameters=hyperparameters)
+
+        emulator.fit(self.training_data)
+        self.assertEqual("fit", emulator.gp.nugget_type)
+
     def test_fit_ignores_inputs_targets(self):
         """Test that fitting ignores any inputs and targets supplied during
         initialisation of the emulator."""
@@ -640,7 +663,7 @@ class TestMogpEmulator(ExauqTestCase):
         self.assertEqual(tuple(), emulator.training_data)
 
         # Case where data has previously been fit
-        emulator.fit(TrainingDatum.list_from_arrays(self.inputs_arr, self.targets_arr))
+        emulator.fit(self.arrays_training_data)
         expected_inputs = emulator.gp.inputs
         expected_targets = emulator.gp.targets
         expected_training_data = emulator.training_data
@@ -656,8 +679,7 @@ class TestMogpEmulator(ExauqTestCase):
         hyperparameters can be retrieved and agree with those in the underlying
         MOGP GaussianProcess object."""
 
-        emulator = MogpEmulator()
-        emulator.fit(self.training_data)
+        emulator = self.fitted_emulator
         self.assertEqual(
             MogpHyperparameters.from_mogp_gp_params(emulator.gp.theta),
             emulator.fit_hyperparameters,
@@ -747,8 +769,7 @@ class TestMogpEmulator(ExauqTestCase):
         """Given a trained emulator, check that predict() returns a
         GaussianProcessPrediction object."""
 
-        emulator = MogpEmulator()
-        emulator.fit(self.training_data)
+        emulator = self.fitted_emulator
 
         self.assertIsInstance(emulator.predict(self.x), GaussianProcessPrediction)
 
@@ -783,8 +804,7 @@ class TestMogpEmulator(ExauqTestCase):
         """Given a trained emulator, test that a ValueError is raised if the dimension
         of the input is not the same as for the training data."""
 
-        emulator = MogpEmulator()
-        emulator.fit(self.training_data)
+        emulator = self.fitted_emulator
         expected_dim = len(self.training_data[0].input)
 
         for x in [Input(), Input(0.5), Input(0.5, 0.5, 0.5)]:
@@ -801,20 +821,23 @@ class TestMogpEmulator(ExauqTestCase):
         """Given an emulator trained on data, test that the training data inputs are
         predicted exactly with no uncertainty."""
 
-        emulator = MogpEmulator()
-        emulator.fit(self.training_data)
-        for datum in self.training_data:
-            self.assertEqual(
-                GaussianProcessPrediction(estimate=datum.output, variance=0),
-                emulator.predict(datum.input),
-            )
+        # Note: predictions are made in one batch; agreement between predict_batch and
+        # predict is checked separately.
+        emulator = self.fitted_emulator
+        expected = tuple(
+            GaussianProcessPrediction(estimate=datum.output, variance=0)
+            for datum in self.training_data
+        )
+        self.assertEqual(
+            expected,
+            emulator.predict_batch([datum.input for datum in self.training_data]),
+        )
 
     def test_predict_away_training_data_points(self):
         """Given an emulator trained on data, test that predictions away from the data
         inputs have uncertainty."""
 
-        emulator = MogpEmulator()
-        emulator.fit(self.training_data)
+        emulator = self.fitted_emulator
 
         # Note: use list in the following because Inputs aren't hashable
         training_inputs = [datum.input for datum in self.training_data]
@@ -823,6 +846,79 @@ class TestMogpEmulator(ExauqTestCase):
             assert x not in training_inputs
             self.assertTrue(emulator.predict(x).variance > 0)
 
+    def test_predict_batch_agrees_with_predict(self):
+        """Given an emulator trained on data, test that predicting at a batch of inputs
+        gives the same predictions as predicting at each input in turn."""
+
+        emulator = self.fitted_emulator
+        inputs = [datum.input for datum in self.training_data] + [
+            Input(0.1 * n, 0.1 * n) for n in range(1, 10)
+        ]
+
+        self.assertEqual(
+            tuple(emulator.predict(x) for x in inputs), emulator.predict_batch(inputs)
+        )
+
+    def test_predict_batch_empty_inputs(self):
+        """Given a trained emulator, test that an empty tuple is returned when predicting
+        at an empty sequence of inputs."""
+
+        emulator = self.fitted_emulator
+
+        self.assertEqual(tuple(), emulator.predict_batch([]))
+
+    def test_predict_batch_arg_type_errors(self):
+        """Given an emulator, test that a TypeError is raised if the inputs are not a
+        sequence of Input objects."""
+
+        emulator = self.fitted_emulator
+
+        inputs = iter([self.x])
+        with self.assertRaisesRegex(
+            TypeError,
+            exact(
+                "Expected 'inputs' to be a sequence of Input objects, but received "
+                f"{type(inputs)} instead."
+            ),
+        ):
+            emulator.predict_batch(inputs)
+
+        with self.assertRaisesRegex(
+            TypeError, exact("Expected 'inputs' to only contain Input objects.")
+        ):
+            emulator.predict_batch([self.x, (0.5, 0.5)])
+
+    def test_predict_batch_not_trained_error(self):
+        """Given an emulator that hasn't been trained on data, test that a RuntimeError
+        is raised when using the emulator to make predictions."""
+
+        emulator = MogpEmulator()
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            exact(
+                "Cannot make prediction because emulator has not been trained on any data."
+            ),
+        ):
+            emulator.predict_batch([self.x])
+
+    def test_predict_batch_input_wrong_dim_error(self):
+        """Given a trained emulator, test that a ValueError is raised if the dimension
+        of any of the inputs is not the same as for the training data."""
+
+        emulator = self.fitted_emulator
+        expected_dim = len(self.training_data[0].input)
+
+        for x in [Input(), Input(0.5), Input(0.5, 0.5, 0.5)]:
+            with self.subTest(x=x), self.assertRaisesRegex(
+                ValueError,
+                exact(
+                    f"Expected inputs to have dimension equal to {expected_dim}, but "
+                    f"received input of dimension {len(x)}."
+                ),
+            ):
+                emulator.predict_batch([self.x, x])
+
 
 class TestMogpHyperparameters(ExauqTestCase):
     def setUp(self) -> None:
@@ -4,7 +4,8 @@ from unittest.mock import MagicMock, call, patch
 
 from paramiko.ssh_exception import AuthenticationException
 
-from exauq.sim_management.hardware import HardwareInterface, SSHInterface
+from exauq.sim_management.hardware import HardwareInterface, JobStatus, SSHInterface
+from exauq.sim_management.jobs import JobId
 
 
 class TestHardwareInterface(unittest.TestCase):
@@ -13,6 +14,22 @@ class TestHardwareInterface(unittest.TestCase):
         with self.assertRaises(TypeError):
             _ = HardwareInterface()
 
+    def test_get_job_statuses_defaults_to_get_job_status(self):
+        """Test that, by default, the statuses of several jobs are got by getting the
+        status of each job in turn."""
+
+        class StatusInterface(HardwareInterface):
+            submit_job = get_job_output = cancel_job = MagicMock()
+
+            def get_job_status(self, job_id):
+                return JobStatus.RUNNING if job_id == JobId("1") else JobStatus.FAILED
+
+        interface = StatusInterface("interface")
+        self.assertEqual(
+            {JobId("1"): JobStatus.RUNNING, JobId("2"): JobStatus.FAILED},
+            interface.get_job_statuses([JobId("1"), JobId("2")]),
+        )
+
 
 class MockedSSHInterface(SSHInterface):
     def submit_job(self, job):
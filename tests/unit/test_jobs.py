@@ -22,7 +22,7 @@ class TestJobId(ExauqTestCase):
         """A ValueError is raised if the supplied job ID whose string representation
         contains characters other than digits."""
 
-        for job_id in ["", "rm -rf ~", "!", -1, "0.1", "1e10", 2j, [1]]:
+        for job_id in ["", "rm -rf ~", "!", -1, "0.1", "1e10", 2j, [1], "²", "١٢"]:
             with self.subTest(job_id=job_id):
                 with self.assertRaisesRegex(
                     ValueError,
@@ -55,6 +55,12 @@ class TestJobId(ExauqTestCase):
         except TypeError:
             self.fail("Expected object to be hashable")
 
+    def test_no_new_attributes(self):
+        """New attributes cannot be added to JobId objects."""
+
+        with self.assertRaises(AttributeError):
+            JobId(1).foo = "bar"
+
 
 class TestJob(ExauqTestCase):
     def test_init_valid_ids(self):
@@ -111,6 +117,12 @@ class TestJob(ExauqTestCase):
         with self.assertRaises(AttributeError):
             job.data = Input(-1)
 
+    def test_no_new_attributes(self):
+        """New attributes cannot be added to Job objects."""
+
+        with self.assertRaises(AttributeError):
+            Job(id_=1, data=Input(0)).foo = "bar"
+
     def test_equality(self):
         """Two jobs are equally precisely when their IDs and input data are equal."""
 
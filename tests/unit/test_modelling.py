@@ -145,6 +145,24 @@ class TestInput(unittest.TestCase):
         self.assertEqual(1, len(Input(0)))
         self.assertEqual(2, len(Input(0, 0)))
 
+    def test_iter(self):
+        """Test that iterating over the input gives the coordinates in order (or nothing
+        if empty)."""
+        self.assertEqual([], list(Input()))
+        self.assertEqual([1], list(Input(1)))
+        self.assertEqual([1, 2.5], list(Input(1, 2.5)))
+
+    def test_level_can_be_set(self):
+        """Test that a level can be attached to an input and then removed."""
+
+        x = set_level(Input(1, 2), 3)
+        self.assertIsInstance(x, LevelTagged)
+        self.assertEqual(3, get_level(x))
+        self.assertEqual(3, get_level(copy.deepcopy(x)))
+
+        x = remove_level(x)
+        self.assertNotIsInstance(x, LevelTagged)
+
     def test_getitem_int(self):
         """Test that individual coordinates of the input can be accessed with ints
         (with indexing starting at 0)."""
@@ -381,6 +399,40 @@ class TestTrainingDatum(unittest.TestCase):
         ]
         self.assertEqual(expected, TrainingDatum.list_from_arrays(inputs, outputs))
 
+    def test_arrays_from_list(self):
+        """Test that Numpy arrays of inputs and outputs are created from a list of
+        training data, inverting the construction in list_from_arrays."""
+
+        inputs = np.array([[0.2, 1.1], [-2, 3000.9], [3.5, 9.87]])
+        outputs = np.array([-1, 0, 1.1])
+        data = TrainingDatum.list_from_arrays(inputs, outputs)
+        arr_inputs, arr_outputs = TrainingDatum.arrays_from_list(data)
+        self.assertEqual((3, 2), arr_inputs.shape)
+        self.assertEqual((3,), arr_outputs.shape)
+        self.assertTrue(np.array_equal(inputs, arr_inputs))
+        self.assertTrue(np.array_equal(outputs, arr_outputs))
+
+    def test_arrays_from_list_one_dim_inputs(self):
+        """Test that one-dimensional inputs are stacked into a single column."""
+
+        data = [TrainingDatum(Input(1), 2), TrainingDatum(Input(3), 4)]
+        arr_inputs, arr_outputs = TrainingDatum.arrays_from_list(data)
+        self.assertTrue(np.array_equal(np.array([[1.0], [3.0]]), arr_inputs))
+        self.assertTrue(np.array_equal(np.array([2.0, 4.0]), arr_outputs))
+
+    def test_arrays_from_list_mismatched_dims_error(self):
+        """Test that a ValueError is raised if the inputs in the training data do not
+        all have the same dimension."""
+
+        data = [TrainingDatum(Input(1, 2), 2), TrainingDatum(Input(3), 4)]
+        with self.assertRaisesRegex(
+            ValueError,
+            exact(
+                "Expected all inputs in 'data' to have the same number of coordinates."
+            ),
+        ):
+            TrainingDatum.arrays_from_list(data)
+
     def test_read_from_csv_default_output_column(self):
         """By default, the csv data is read into a sequence of training data where the
         last column in the csv file defines the simulator outputs and the other columns
@@ -1033,6 +1085,20 @@ class TestGaussianProcessHyperparameters(ExauqTestCase):
                     corr_length_scales=corr, process_var=1.0, nugget=1.0
                 )
 
+        # correlations given as a Numpy array, reporting the first bad element
+        for bad_value in self.nonpositive_reals:
+            corr = np.array([1.0, bad_value, -1.0])
+            with self.subTest(corr=corr), self.assertRaisesRegex(
+                ValueError,
+                exact(
+                    "Expected 'corr_length_scales' to be a sequence or Numpy array of positive real numbers, "
+                    f"but found element {corr[1]} of type {type(corr[1])}."
+                ),
+            ):
+                _ = GaussianProcessHyperparameters(
+                    corr_length_scales=corr, process_var=1.0, nugget=1.0
+                )
+
         # process variance
         for cov in self.nonpositive_reals:
             with self.subTest(cov=cov), self.assertRaisesRegex(
@@ -1137,6 +1203,15 @@ class TestGaussianProcessHyperparameters(ExauqTestCase):
             ),
         )
 
+    def test_equals_not_true_if_different_numbers_of_corr_length_scales(self):
+        """Two instances of GaussianProcessHyperparameters are not equal if they have
+        different numbers of correlation length scales."""
+
+        self.assertNotEqual(
+            GaussianProcessHyperparameters([1], 1, 1),
+            GaussianProcessHyperparameters([1, 1], 1, 1),
+        )
+
     def test_equals_not_true_if_different_types(self):
         """A GaussianProcessHyperparameters instance is not equal to an object of a
         different type."""
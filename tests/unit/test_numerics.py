@@ -13,8 +13,8 @@ class TestEqualWithinTolerance(unittest.TestCase):
         self.non_finite_values = [-math.inf, math.nan, math.inf]
 
     def assertAgreeOnRange(self, func1, func2, _range):
-        for x in _range:
-            self.assertIs(func1(x), func2(x))
+        disagreements = [x for x in _range if func1(x) is not func2(x)]
+        self.assertEqual([], disagreements, "functions disagree at the given points")
 
     def test_equal_to_math_isclose_relative_tolerances(self):
         """Test that whether two reals are equal up to a relative tolerance agrees with
@@ -171,6 +171,27 @@ class TestEqualWithinTolerance(unittest.TestCase):
         y = (1, 2, 3, 4)
         self.assertFalse(equal_within_tolerance(x, y))
 
+    def test_sequences_agree_with_elementwise_comparison(self):
+        """Comparing sequences agrees with comparing each pair of corresponding
+        elements, including for non-finite values."""
+
+        values = self.non_finite_values + [-1, -0.001, 0, 0.99999, 1, 1.1]
+        for x, y in itertools.product(values, values):
+            with self.subTest(x=x, y=y):
+                self.assertIs(
+                    equal_within_tolerance(x, y),
+                    equal_within_tolerance([1, x], np.array([1, y])),
+                )
+
+    def test_sequences_non_real_elements_error(self):
+        """A TypeError is raised if a sequence contains elements that are not real
+        numbers."""
+
+        for x in [["1", 2], [None, 2]]:
+            with self.subTest(x=x):
+                with self.assertRaises(TypeError):
+                    equal_within_tolerance(x, [1, 2])
+
 
 class TestSetTolerance(unittest.TestCase):
     def setup(self) -> None:
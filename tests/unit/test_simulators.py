@@ -8,9 +8,10 @@ from numbers import Real
 from threading import Thread
 from time import sleep
 from typing import Type
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from exauq.core.modelling import Input, SimulatorDomain
+from exauq.core.numerics import FLOAT_TOLERANCE, set_tolerance
 from exauq.sim_management.hardware import HardwareInterface, JobStatus
 from exauq.sim_management.jobs import Job, JobId
 from exauq.sim_management.simulators import (
@@ -73,6 +74,11 @@ def make_fake_simulations_log_class(
 
             return self.simulations
 
+        def lookup(self, x: Input):
+            """Return the first pre-loaded simulation with the given input."""
+
+            return next((sim for sim in self.simulations if sim[0] == x), None)
+
         def add_new_record(self, x: Input):
             """Add the input to the list of simulations, with ``None`` as output. This
             represents a simulation being added as a pending job."""
@@ -254,6 +260,60 @@ class TestSimulator(unittest.TestCase):
             with self.subTest(x=x, y=y):
                 self.assertEqual(y, simulator.compute(x))
 
+    def test_compute_many_non_input_error(self):
+        """Test that a TypeError is raised, and nothing is submitted, if an argument of
+        type other than Input is supplied for computation."""
+
+        x = "a"
+        with self.assertRaisesRegex(
+            TypeError,
+            exact(
+                "Argument 'inputs' must only contain objects of type Input, but "
+                f"received {type(x)}."
+            ),
+        ):
+            self.empty_simulator.compute_many([Input(2), x])
+
+        self.assertEqual(tuple(), self.empty_simulator.previous_simulations)
+
+    def test_compute_many_same_as_compute_in_turn(self):
+        """Test that computing several inputs together returns the same outputs, and
+        records the same simulations, as computing the inputs one at a time."""
+
+        simulations = ((Input(1), 0), (Input(2), None))
+        inputs = [Input(3), Input(1), Input(2), Input(4)]
+        simulator1 = make_fake_simulator(simulations)
+        simulator2 = make_fake_simulator(simulations)
+
+        self.assertEqual(
+            tuple(simulator1.compute(x) for x in inputs), simulator2.compute_many(inputs)
+        )
+        self.assertEqual(simulator1.previous_simulations, simulator2.previous_simulations)
+
+    def test_compute_many_repeated_new_input_submitted_once(self):
+        """Test that a new input that is repeated within the inputs to compute is only
+        submitted once."""
+
+        x = Input(2)
+        self.assertEqual((None, None), self.empty_simulator.compute_many([x, x]))
+        self.assertEqual(((x, None),), self.empty_simulator.previous_simulations)
+
+    def test_compute_many_repeated_new_input_within_tolerance_submitted_once(self):
+        """Test that new inputs that are equal within tolerance are only submitted once,
+        in the same way as when computing the inputs one at a time."""
+
+        inputs = [Input(2), Input(2 + FLOAT_TOLERANCE / 10)]
+        simulator = make_fake_simulator(tuple())
+
+        self.assertEqual((None, None), self.empty_simulator.compute_many(inputs))
+        for x in inputs:
+            simulator.compute(x)
+
+        self.assertEqual(
+            simulator.previous_simulations, self.empty_simulator.previous_simulations
+        )
+        self.assertEqual(1, len(self.empty_simulator.previous_simulations))
+
 
 class TestSimulationsLog(unittest.TestCase):
     def setUp(self) -> None:
@@ -387,6 +447,122 @@ class TestSimulationsLog(unittest.TestCase):
         expected = ((Input(10, 1), 2),)
         self.assertEqual(expected, log.get_simulations())
 
+    def test_get_simulations_non_finite_input_error(self):
+        """Test that a ValueError is raised if the log file contains a simulation input
+        with a non-finite coordinate."""
+
+        self.simulations_file.write_text(
+            "Input_1,Output,Job_ID,Job_Status,Job_Level,Interface_Name\n"
+            "1,2,0,Completed,1,server_01\n"
+            "inf,,1,Submitted,1,server_01\n"
+        )
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        with self.assertRaisesRegex(
+            ValueError, exact("Cannot supply NaN or non-finite numbers as arguments")
+        ):
+            log.get_simulations()
+
+    def test_lookup_returns_simulation_from_file(self):
+        """Test that looking up an input returns the simulation with that input from the
+        log file, or None if there is no such simulation."""
+
+        self.simulations_file.write_text(
+            "Input_1,Input_2,Output,Job_ID,Job_Status,Job_Level,Interface_Name\n"
+            "1,2,10,1,Completed,1,server_01\n"
+            "3,4,,2,Submitted,1,server_01\n"
+        )
+        log = SimulationsLog(self.simulations_file, input_dim=2)
+
+        self.assertEqual((Input(1, 2), 10), log.lookup(Input(1, 2)))
+        self.assertEqual((Input(3, 4), None), log.lookup(Input(3, 4)))
+        self.assertIsNone(log.lookup(Input(5, 6)))
+
+    def test_lookup_compares_inputs_up_to_tolerance(self):
+        """Test that looking up an input finds simulations whose inputs are equal to it
+        up to numerical tolerance."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(0.3), job_id="1")
+
+        self.assertEqual((Input(0.3), None), log.lookup(Input(0.1 + 0.2)))
+
+    def test_lookup_compares_inputs_up_to_relative_tolerance(self):
+        """Test that looking up an input finds simulations whose inputs are equal to it
+        up to relative tolerance, for simulations recorded both before and after the
+        first lookup, and doesn't find simulations whose inputs only agree in the first
+        coordinate."""
+
+        set_tolerance(FLOAT_TOLERANCE)
+        self.addCleanup(set_tolerance, FLOAT_TOLERANCE)
+        log = SimulationsLog(self.simulations_file, input_dim=2)
+        log.add_new_record(Input(-1e6, 1), job_id="1")
+        self.assertIsNone(log.lookup(Input(0, 0)))
+        log.add_new_record(Input(1e6, 1), job_id="2")
+        delta = 1e6 * FLOAT_TOLERANCE / 2
+
+        for x in [Input(-1e6, 1), Input(1e6, 1)]:
+            with self.subTest(x=x):
+                self.assertEqual((x, None), log.lookup(Input(x[0] + delta, 1)))
+                self.assertEqual((x, None), log.lookup(Input(x[0] - delta, 1)))
+                self.assertIsNone(log.lookup(Input(x[0], 2)))
+                self.assertIsNone(log.lookup(Input(x[0] + 4 * delta, 1)))
+
+    def test_lookup_uses_current_tolerance(self):
+        """Test that looking up an input compares inputs up to the tolerance in use at
+        the time of the lookup."""
+
+        set_tolerance(FLOAT_TOLERANCE)
+        self.addCleanup(set_tolerance, FLOAT_TOLERANCE)
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(1), job_id="1")
+        self.assertIsNone(log.lookup(Input(1 + 1e-5)))
+
+        set_tolerance(1e-4)
+        self.assertEqual((Input(1), None), log.lookup(Input(1 + 1e-5)))
+
+    def test_lookup_only_compares_inputs_with_close_first_coordinate(self):
+        """Test that looking up an input not in the log file doesn't compare it with the
+        inputs of all simulations in the log."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_records([Job(str(n), Input(n)) for n in range(1, 101)])
+
+        with patch.object(Input, "__eq__", autospec=True, side_effect=Input.__eq__) as eq:
+            miss = log.lookup(Input(0.5))
+            hit = log.lookup(Input(50 + FLOAT_TOLERANCE))
+
+        self.assertEqual(1, eq.call_count)
+        self.assertIsNone(miss)
+        self.assertEqual((Input(50), None), hit)
+
+    def test_lookup_prefers_exactly_equal_input(self):
+        """Test that looking up an input returns a simulation with exactly the same
+        input in preference to an earlier simulation with input only equal to it up to
+        numerical tolerance."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(0.3), job_id="1")
+        log.add_new_record(Input(0.1 + 0.2), job_id="2")
+        log.insert_result(job_id="2", result=1)
+
+        self.assertEqual((Input(0.1 + 0.2), 1), log.lookup(Input(0.1 + 0.2)))
+        self.assertEqual((Input(0.3), None), log.lookup(Input(0.3)))
+
+    def test_lookup_reflects_records_added_and_updated(self):
+        """Test that looking up inputs reflects records that have been added and results
+        that have been inserted since the first lookup."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        self.assertIsNone(log.lookup(Input(1)))
+
+        log.add_new_record(Input(1), job_id="1")
+        log.add_new_records([Job("2", Input(2), interface_name="interface1")])
+        self.assertEqual((Input(1), None), log.lookup(Input(1)))
+        self.assertEqual((Input(2), None), log.lookup(Input(2)))
+
+        log.insert_result(job_id="2", result=0)
+        self.assertEqual((Input(2), 0), log.lookup(Input(2)))
+
     def test_add_new_record_input_wrong_dim_error(self):
         """Test that a ValueError is raised if the supplied input has a different number
         of coordinates to that expected of simulator inputs in the log file."""
@@ -474,6 +650,97 @@ class TestSimulationsLog(unittest.TestCase):
         log.add_new_record(x2, "2")
         self.assertEqual((x1, x2), log.get_unsubmitted_inputs())
 
+    def test_add_new_records(self):
+        """Test that, when records for several jobs are added together, the
+        corresponding simulations show up in the log in the order given."""
+
+        jobs = [
+            Job("1", Input(1), interface_name="interface1"),
+            Job("2", Input(2), level=2, interface_name="interface2"),
+        ]
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_records(jobs)
+        self.assertEqual(((Input(1), None), (Input(2), None)), log.get_simulations())
+        self.assertEqual(tuple(jobs), log.get_non_terminated_jobs())
+
+    def test_add_new_records_duplicate_id_error(self):
+        """Test that a ValueError is raised, and no records are added, if any of the job
+        IDs is already in use or is repeated amongst the jobs supplied."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(1), "1")
+        for job_ids in [("2", "1"), ("2", "2")]:
+            with self.subTest(job_ids=job_ids):
+                with self.assertRaisesRegex(
+                    ValueError, exact(f"The job_id '{job_ids[1]}' is already in use.")
+                ):
+                    log.add_new_records([Job(job_id, Input(1)) for job_id in job_ids])
+
+                self.assertEqual(((Input(1), None),), log.get_simulations())
+
+    def test_add_new_records_duplicate_id_added_by_other_log_error(self):
+        """Test that a ValueError is raised if one of the job IDs has been recorded in
+        the log file through another log since the index of simulations was built."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(1), "1")
+        _ = log.lookup(Input(1))
+        other_log = SimulationsLog(self.simulations_file, input_dim=1)
+        other_log.add_new_record(Input(2), "2")
+        with self.assertRaisesRegex(
+            ValueError, exact("The job_id '2' is already in use.")
+        ):
+            log.add_new_records([Job("2", Input(3))])
+
+        self.assertEqual(((Input(1), None), (Input(2), None)), log.get_simulations())
+
+    def test_add_new_records_input_wrong_dim_error(self):
+        """Test that a ValueError is raised, and no records are added, if any of the
+        inputs has a different number of coordinates to that expected."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        with self.assertRaisesRegex(
+            ValueError,
+            exact("Expected input 'x' to have 1 coordinates, but got 2 instead."),
+        ):
+            log.add_new_records([Job("1", Input(1)), Job("2", Input(1, 2))])
+
+        self.assertEqual(tuple(), log.get_simulations())
+
+    def test_get_records_filters_on_job_ids(self):
+        """Test that only records for the given job IDs are returned, where the IDs can
+        be supplied as strings, integers or JobIds."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        for n in range(1, 5):
+            log.add_new_record(Input(n), str(n))
+
+        records = log.get_records(job_ids=["1", 3, JobId("4"), "5"])
+        self.assertEqual(
+            [JobId("1"), JobId("3"), JobId("4")], [record["job_id"] for record in records]
+        )
+        self.assertEqual(
+            [Input(1), Input(3), Input(4)], [record["input"] for record in records]
+        )
+
+    def test_get_records_filters_on_statuses_and_job_ids(self):
+        """Test that only records having one of the given statuses are returned, further
+        restricted to the given job IDs if these are supplied."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        statuses = [JobStatus.RUNNING, JobStatus.COMPLETED, JobStatus.RUNNING]
+        for n, status in enumerate(statuses, start=1):
+            log.add_new_record(Input(n), str(n), job_status=status)
+
+        records = log.get_records(statuses=[JobStatus.RUNNING])
+        self.assertEqual(
+            [(JobId("1"), JobStatus.RUNNING), (JobId("3"), JobStatus.RUNNING)],
+            [(record["job_id"], record["status"]) for record in records],
+        )
+
+        records = log.get_records(job_ids=["2", "3"], statuses=[JobStatus.RUNNING])
+        self.assertEqual([JobId("3")], [record["job_id"] for record in records])
+
     def test_insert_result_missing_job_id_error(self):
         """Test that a SimulationsLogLookupError is raised if one attempts to add an
         output with a job ID that doesn't exist in the simulations log file."""
@@ -491,6 +758,40 @@ class TestSimulationsLog(unittest.TestCase):
         ):
             log.insert_result(job_id, 10)
 
+    def test_insert_results_adds_outputs_and_statuses(self):
+        """Test that several simulation outputs can be inserted in one go, optionally
+        updating the statuses of the jobs at the same time."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        for job_id in ["1", "2", "3"]:
+            log.add_new_record(Input(int(job_id)), job_id, job_status=JobStatus.RUNNING)
+
+        log.insert_results([("3", 30), (JobId("1"), 10)], job_status=JobStatus.COMPLETED)
+
+        self.assertEqual(
+            ((Input(1), 10), (Input(2), None), (Input(3), 30)), log.get_simulations()
+        )
+        self.assertEqual(JobStatus.COMPLETED, log.get_job_status("1"))
+        self.assertEqual(JobStatus.RUNNING, log.get_job_status("2"))
+        self.assertEqual(JobStatus.COMPLETED, log.get_job_status("3"))
+
+    def test_insert_results_missing_job_id_error(self):
+        """Test that a SimulationsLogLookupError is raised, and no outputs are inserted,
+        if one of the job IDs doesn't exist in the simulations log file."""
+
+        log = SimulationsLog(self.simulations_file, input_dim=1)
+        log.add_new_record(Input(1), "0")
+        with self.assertRaisesRegex(
+            SimulationsLogLookupError,
+            exact(
+                "Could not add output to simulation with job ID = 1: "
+                "no such simulation exists."
+            ),
+        ):
+            log.insert_results([("0", 10), ("1", 20)])
+
+        self.assertEqual(((Input(1), None),), log.get_simulations())
+
     def test_get_non_terminated_jobs_empty_log_file(self):
         """Test that an empty tuple of non terminated jobs is returned if there are no
         records in the simulations log file."""
@@ -613,11 +914,72 @@ class TestJobManager(unittest.TestCase):
         self.assertEqual(job2.id, JobId("456"))
         self.assertEqual(len(self.job_manager._monitored_jobs), 2)
 
+    def test_submit_many(self):
+        """Test that several jobs are submitted and recorded together."""
+        inputs = [Input(1.0, 2.0), Input(3.0, 4.0)]
+
+        with patch(
+            "exauq.sim_management.simulators.JobIDGenerator.generate_id",
+            side_effect=[JobId("123"), JobId("456")],
+        ):
+            jobs = self.job_manager.submit_many(inputs)
+
+        self.assertEqual((JobId("123"), JobId("456")), tuple(job.id for job in jobs))
+        self.assertEqual(tuple(inputs), tuple(job.data for job in jobs))
+        self.mock_simulations_log.add_new_records.assert_called_once_with(
+            jobs, job_status=JobStatus.PENDING_SUBMIT
+        )
+        self.assertEqual(len(self.job_manager._monitored_jobs), 2)
+
+    def test_submit_many_spreads_jobs_across_interfaces(self):
+        """Test that jobs submitted together are spread across the interfaces for their
+        level in the same way as jobs submitted one at a time."""
+        extra_interface = Mock(spec=HardwareInterface)
+        extra_interface.name = "mock_interface3"
+        extra_interface.level = 1
+        job_manager = JobManager(
+            self.mock_simulations_log, [self.mock_interface1, extra_interface]
+        )
+
+        with patch("exauq.sim_management.simulators.JobManager.monitor"):
+            jobs = job_manager.submit_many([Input(1.0, 2.0)] * 3)
+
+        self.assertEqual(
+            ["mock_interface1", "mock_interface3", "mock_interface1"],
+            [job.interface_name for job in jobs],
+        )
+        job_manager.shutdown()
+
+    def test_submit_many_no_inputs(self):
+        """Test that submitting no inputs returns an empty tuple without recording
+        anything, even if there are no interfaces for the level."""
+
+        self.assertEqual((), self.job_manager.submit_many([], level=3))
+        self.mock_simulations_log.add_new_records.assert_not_called()
+        self.assertEqual(0, len(self.job_manager._monitored_jobs))
+
+    def test_submit_many_non_input_error(self):
+        """Test that a TypeError is raised, and no jobs are recorded, if any of the
+        inputs is not an Input."""
+
+        for x in ["a", 1, (0, 0)]:
+            with self.subTest(x=x):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    exact(
+                        "Argument 'inputs' must only contain objects of type Input, but "
+                        f"received {type(x)}."
+                    ),
+                ):
+                    self.job_manager.submit_many([Input(1.0, 2.0), x])
+
+        self.mock_simulations_log.add_new_records.assert_not_called()
+
     def test_cancel(self):
         """Test that a job can be cancelled and its status is updated."""
         job_id = JobId("123")
         mock_job = Job(job_id, Input(1.0, 2.0), 1, "mock_interface")
-        self.job_manager._monitored_jobs = [mock_job]
+        self.job_manager._monitored_jobs = {mock_job.id: mock_job}
 
         cancelled_job = self.job_manager.cancel(job_id)
 
@@ -656,7 +1018,7 @@ class TestJobManager(unittest.TestCase):
         active_job_id = JobId("777")
         active_job = Job(active_job_id, Input(1.0, 2.0), 1, "mock_interface")
 
-        self.job_manager._monitored_jobs = [active_job]
+        self.job_manager._monitored_jobs = {active_job.id: active_job}
 
         cancelled_job = self.job_manager.cancel(active_job_id)
 
@@ -673,8 +1035,8 @@ class TestJobManager(unittest.TestCase):
         self.job_manager.monitor([job1, job2])
 
         self.assertEqual(len(self.job_manager._monitored_jobs), 2)
-        self.assertIn(job1, self.job_manager._monitored_jobs)
-        self.assertIn(job2, self.job_manager._monitored_jobs)
+        self.assertIn(job1, self.job_manager._monitored_jobs.values())
+        self.assertIn(job2, self.job_manager._monitored_jobs.values())
 
     @patch("threading.Thread.start")
     def test_monitor_jobs_thread_creation(self, mock_thread_start):
@@ -687,7 +1049,7 @@ class TestJobManager(unittest.TestCase):
         self.assertIsInstance(self.job_manager._thread, Thread)
         mock_thread_start.assert_called_once()
 
-        self.assertIn(job, self.job_manager._monitored_jobs)
+        self.assertIn(job, self.job_manager._monitored_jobs.values())
 
     def test_monitor_with_existing_jobs(self):
         """Test that existing non-terminated jobs are added to monitored jobs on
@@ -699,10 +1061,78 @@ class TestJobManager(unittest.TestCase):
             self.mock_simulations_log, [self.mock_interface1, self.mock_interface2]
         )
 
-        self.assertIn(existing_job, new_job_manager._monitored_jobs)
+        self.assertIn(existing_job, new_job_manager._monitored_jobs.values())
 
         new_job_manager.shutdown()
 
+    def test_get_job_statuses_one_request_per_interface(self):
+        """Test that the statuses of submitted jobs are got from their hardware
+        interfaces with one request per interface, while the statuses of jobs pending
+        submission are taken from the simulations log."""
+        jobs = [
+            Job(JobId("1"), Input(1.0, 2.0), 1, "mock_interface1"),
+            Job(JobId("2"), Input(3.0, 4.0), 1, "mock_interface1"),
+            Job(JobId("3"), Input(5.0, 6.0), 1, "mock_interface1"),
+        ]
+        self.mock_simulations_log.get_job_status.side_effect = [
+            JobStatus.RUNNING,
+            JobStatus.PENDING_SUBMIT,
+            JobStatus.SUBMITTED,
+        ]
+        self.mock_interface1.get_job_statuses.return_value = {
+            JobId("1"): JobStatus.COMPLETED,
+            JobId("3"): JobStatus.RUNNING,
+        }
+
+        statuses = self.job_manager._get_job_statuses(jobs)
+
+        self.mock_interface1.get_job_statuses.assert_called_once_with(
+            [JobId("1"), JobId("3")]
+        )
+        self.assertEqual(
+            {
+                JobId("1"): JobStatus.COMPLETED,
+                JobId("2"): JobStatus.PENDING_SUBMIT,
+                JobId("3"): JobStatus.RUNNING,
+            },
+            statuses,
+        )
+
+    def test_monitor_jobs_retries_job_missing_from_statuses(self):
+        """Test that a job whose status is not returned by its hardware interface is
+        skipped, without stopping the handling of other jobs, and is retried on the next
+        polling cycle."""
+        job1 = Job(JobId("1"), Input(1.0, 2.0), 1, "mock_interface1")
+        job2 = Job(JobId("2"), Input(3.0, 4.0), 1, "mock_interface1")
+        self.job_manager._monitored_jobs = {job1.id: job1, job2.id: job2}
+        self.job_manager._polling_interval = 0
+
+        cycles = [
+            {JobId("2"): JobStatus.RUNNING},
+            {JobId("1"): JobStatus.RUNNING, JobId("2"): JobStatus.RUNNING},
+        ]
+
+        def get_job_statuses(jobs):
+            if not cycles:
+                self.job_manager._shutdown_event.set()
+                return None
+
+            return cycles.pop(0)
+
+        with patch.object(
+            self.job_manager, "_get_job_statuses", side_effect=get_job_statuses
+        ), patch.object(self.job_manager, "_handle_job") as mock_handle_job:
+            self.job_manager._monitor_jobs()
+
+        self.assertEqual(
+            [
+                call(job2, JobStatus.RUNNING),
+                call(job1, JobStatus.RUNNING),
+                call(job2, JobStatus.RUNNING),
+            ],
+            mock_handle_job.call_args_list,
+        )
+
     def test_get_interface(self):
         """Test that the correct interface is retrieved by name."""
         interface = self.job_manager.get_interface("mock_interface1")
@@ -724,7 +1154,7 @@ class TestJobManager(unittest.TestCase):
         """Test that a job is correctly removed from monitored jobs and the count is
         updated."""
         job = Job(JobId("123"), Input(1.0, 2.0), 1, "mock_interface1")
-        self.job_manager._monitored_jobs = [job]
+        self.job_manager._monitored_jobs = {job.id: job}
         self.job_manager._interface_job_monitor_counts["mock_interface1"] = 1
 
         self.job_manager.remove_job(job)
@@ -785,6 +1215,25 @@ class TestJobStrategies(unittest.TestCase):
         )
         self.mock_job_manager.remove_job.assert_called_once_with(self.mock_job)
 
+    def test_completed_job_strategy_handle_many(self):
+        """Test that CompletedJobStrategy records the outputs and completed statuses of
+        several jobs in one go and removes the jobs."""
+        strategy = CompletedJobStrategy()
+        other_job = Mock(spec=Job)
+        other_job.id = JobId("456")
+        other_job.interface_name = "mock_interface"
+        self.mock_interface.get_job_output.side_effect = [42.0, 43.0]
+
+        strategy.handle_many([self.mock_job, other_job], self.mock_job_manager)
+
+        self.mock_job_manager.simulations_log.insert_results.assert_called_once_with(
+            [("123", 42.0), ("456", 43.0)], job_status=JobStatus.COMPLETED
+        )
+        self.assertEqual(
+            [call(self.mock_job), call(other_job)],
+            self.mock_job_manager.remove_job.call_args_list,
+        )
+
     def test_failed_job_strategy(self):
         """Test that FailedJobStrategy updates job status to FAILED and removes the
         job."""
@@ -1,6 +1,6 @@
 import unittest
 
-from tests.utilities.utilities import exact
+from tests.utilities.utilities import exact, make_window
 
 
 class TestExact(unittest.TestCase):
@@ -19,13 +19,38 @@ class TestExact(unittest.TestCase):
         """Test that backslashes are escaped in the output regex."""
 
         self.assertEqual("^windows\\\\path$", exact("windows\\path"))
-        self.assertEqual("^\noo$", exact("\noo"))
+
+    def test_newline_matches_itself(self):
+        """Test that a newline character in the string is matched literally by the output
+        regex."""
+
+        self.assertRegex("\noo", exact("\noo"))
+        self.assertNotRegex("\\noo", exact("\noo"))
 
     def test_square_brackes(self):
         """Test that square brackets are escaped in the output regex."""
 
         self.assertEqual("^\\[foo\\]$", exact("[foo]"))
 
+    def test_other_metacharacters(self):
+        """Test that other regular expression metacharacters are escaped in the output
+        regex."""
+
+        self.assertEqual("^a\\.b\\*\\{1\\}$", exact("a.b*{1}"))
+
+
+class TestMakeWindow(unittest.TestCase):
+    def test_window_is_read_only(self):
+        """Test that the returned window cannot be modified, as it is shared between
+        calls."""
+
+        for _type in [None, "abs", "rel"]:
+            with self.subTest(type=_type):
+                window = make_window(1, 0.1, type=_type)
+                self.assertIs(window, make_window(1, 0.1, type=_type))
+                with self.assertRaises(ValueError):
+                    window[0] = 0
+
 
 if __name__ == "__main__":
     unittest.main()
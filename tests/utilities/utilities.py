@@ -1,5 +1,7 @@
 """Functions etc. to support testing"""
 
+import functools
+import re
 import unittest
 from numbers import Real
 from typing import Literal, Optional, Tuple
@@ -57,21 +59,15 @@ class ExauqTestCase(unittest.TestCase):
         self.assertFalse(np.array_equal(arr1, arr2, equal_nan=True), "arrays are equal")
 
 
+@functools.lru_cache(maxsize=None)
 def exact(string: str):
     """Turn a string into a regular expressions that defines an exact match on the
     string.
     """
-    escaped = string
-    for char in ["\\", "(", ")", "[", "]"]:
-        escaped = escaped.replace(char, _escape(char))
-
-    return "^" + escaped + "$"
-
-
-def _escape(char):
-    return "\\" + char
+    return "^" + re.escape(string) + "$"
 
 
+@functools.lru_cache(maxsize=64)
 def make_window(
     x: Real, tol: float, type: Optional[Literal["abs", "rel"]] = None, num: int = 50
 ):
@@ -85,18 +81,23 @@ def make_window(
     will be `num` (linearly) equally-spaced numbers between ``(1 - tol) * x`` and
     ``x / (1 - tol)``. If `type` is equal to ``None`` then the type will be set to
     ``"abs"`` if ``abs(x) < tol`` or to ``"rel"`` otherwise.
+
+    Windows are cached and shared between calls, so the returned array is read-only.
     """
 
     if type is None:
         _type = "abs" if abs(x) < tol else "rel"
         return make_window(x, tol, type=_type, num=num)
     if type == "abs":
-        return np.linspace(x - tol, x + tol, num=num)
+        window = np.linspace(x - tol, x + tol, num=num)
     elif type == "rel":
-        return np.linspace(x * (1 - tol), x / (1 - tol), num=num)
+        window = np.linspace(x * (1 - tol), x / (1 - tol), num=num)
     else:
         raise ValueError("'type' must equal one of 'abs' or 'rel'")
 
+    window.setflags(write=False)
+    return window
+
 
 def compare_input_tuples(tuple1: Tuple[Input, ...], tuple2: Tuple[Input, ...]) -> bool:
     """